@@ -59,7 +59,10 @@ const PLAYWRIGHT_PAY_BUTTON_TIMEOUT_MS = 15_000;
 const PLAYWRIGHT_REDIRECT_AWAY_TIMEOUT_MS = 60_000;
 
 const GENERATION_POLL_DEADLINE_MS = 5 * 60_000;
-const GENERATION_POLL_INTERVAL_MS = 5_000;
+// Generation polling starts tight and doubles up to the max interval, so fast
+// runs are observed promptly without hammering the status endpoint on slow ones.
+const GENERATION_POLL_INITIAL_INTERVAL_MS = 1_000;
+const GENERATION_POLL_MAX_INTERVAL_MS = 5_000;
 
 const CHECKOUT_POLL_DEADLINE_MS = 90_000;
 const CHECKOUT_POLL_INTERVAL_MS = 2_000;
@@ -677,6 +680,7 @@ async function main(): Promise<void> {
     const { generationId } = (await startRes.json()) as { generationId: string };
 
     const deadline = Date.now() + GENERATION_POLL_DEADLINE_MS;
+    let pollIntervalMs = GENERATION_POLL_INITIAL_INTERVAL_MS;
     let terminalStatus: "complete" | "failed" | undefined;
     let probeResultStorageId: string | undefined;
     let probeResultUrl: string | undefined;
@@ -713,7 +717,8 @@ async function main(): Promise<void> {
         probeRefundedAt = st.creditRefundedAt;
         break;
       }
-      await sleep(GENERATION_POLL_INTERVAL_MS);
+      await sleep(Math.min(pollIntervalMs, Math.max(0, deadline - Date.now())));
+      pollIntervalMs = Math.min(pollIntervalMs * 2, GENERATION_POLL_MAX_INTERVAL_MS);
     }
 
     const artifactProbe: ArtifactDownloadProbe = terminalStatus === "complete"
@@ -10,8 +10,9 @@ import { mergedReferenceStorageIds } from "./lib/referenceStorageIds.js";
 import {
   createChatSession,
   type GeminiImageResult,
+  getGeminiRetryDelayMs,
+  getGeminiRuntimeConfig,
   normalizeGeminiImageMimeType,
-  readGeminiRuntimeConfigFromEnv,
 } from "./lib/gemini.js";
 import {
   getGenerationRunRetryStatusMessage,
@@ -73,12 +74,36 @@ function aspectRatioMatches(
   return Math.abs(ratio1 - ratio2) / Math.max(ratio1, ratio2) < 0.05;
 }
 
+interface ImageSize {
+  width: number;
+  height: number;
+}
+
+async function readImageSize(raw: Buffer): Promise<ImageSize> {
+  // Header-only read: no pixel data is decoded.
+  const { width, height } = await sharp(raw).metadata();
+  if (!width || !height) {
+    throw new Error("Failed to read image dimensions");
+  }
+  return { width, height };
+}
+
+const PNG_SIGNATURE = Buffer.from([0x89, 0x50, 0x4e, 0x47, 0x0d, 0x0a, 0x1a, 0x0a]);
+
+/** True when the buffer starts with the 8-byte PNG file signature. */
+function hasPngSignature(raw: Buffer): boolean {
+  return raw.length >= PNG_SIGNATURE.length && raw.subarray(0, PNG_SIGNATURE.length).equals(PNG_SIGNATURE);
+}
+
+/**
+ * Decode to RGBA pixels. When `size` is given the resize runs inside the same
+ * libvips pipeline as the decode, so no separate raw-to-raw resize pass is needed.
+ */
 async function decodeImage(
-  base64: string,
+  raw: Buffer,
   mimeType?: string,
+  size?: ImageSize,
 ): Promise<DecodedImage> {
-  const raw = Buffer.from(base64, "base64");
-
   if (raw.length === 0) {
     throw new Error(
       `Gemini returned empty image payload (reported mimeType=${mimeType ?? "unknown"})`,
@@ -86,23 +111,27 @@ async function decodeImage(
   }
 
   // Log diagnostic info for production debugging
-  const signature = raw.subarray(0, 8).toString("hex");
-  const isPng = raw.length >= 8 && raw[0] === 0x89 && raw[1] === 0x50 && raw[2] === 0x4e && raw[3] === 0x47;
+  const isPng = hasPngSignature(raw);
   const isJpeg = raw.length >= 2 && raw[0] === 0xff && raw[1] === 0xd8;
   const detectedFormat = isPng ? "png" : isJpeg ? "jpeg" : "other";
   console.log(
     `[decodeImage] mimeType=${mimeType ?? "unknown"} detectedFormat=${detectedFormat} ` +
-    `bufferLength=${raw.length} signature=${signature}`,
+    `bufferLength=${raw.length}`,
   );
 
   try {
-    const { data, info } = await sharp(raw)
+    const image = sharp(raw);
+    if (size) {
+      image.resize(size.width, size.height);
+    }
+    const { data, info } = await image
       .ensureAlpha()
       .raw()
       .toBuffer({ resolveWithObject: true });
 
     return {
-      pixels: new Uint8ClampedArray(data),
+      // View sharp's output buffer in place instead of copying every pixel.
+      pixels: new Uint8ClampedArray(data.buffer, data.byteOffset, data.byteLength),
       width: info.width,
       height: info.height,
     };
@@ -119,37 +148,26 @@ async function encodePng(
   pixels: Uint8ClampedArray,
   width: number,
   height: number,
+  compressionLevel?: number,
 ): Promise<Buffer> {
-  return sharp(Buffer.from(pixels), {
+  // Wrap the pixel plane as a view; Buffer.from(pixels) would copy every byte first.
+  return sharp(Buffer.from(pixels.buffer, pixels.byteOffset, pixels.byteLength), {
     raw: { width, height, channels: 4 },
   })
-    .png()
+    .png({ compressionLevel })
     .toBuffer();
 }
 
-async function resizeToMatch(
-  pixels: Uint8ClampedArray,
-  srcWidth: number,
-  srcHeight: number,
-  dstWidth: number,
-  dstHeight: number,
-): Promise<Uint8ClampedArray> {
-  const { data } = await sharp(Buffer.from(pixels), {
-    raw: { width: srcWidth, height: srcHeight, channels: 4 },
-  })
-    .resize(dstWidth, dstHeight)
-    .raw()
-    .toBuffer({ resolveWithObject: true });
-
-  return new Uint8ClampedArray(data);
-}
-
 type StageActionContext = Pick<ActionCtx, "runMutation" | "runQuery" | "storage">;
 
 interface PipelineResult {
   matteOutput: MatteOutput;
   whiteDecoded: DecodedImage;
   blackDecoded: DecodedImage;
+  /** The stored white pass, when its bytes can stand in for a re-encoded PNG. */
+  whiteSourcePng?: Buffer;
+  /** The stored black pass, when its bytes can stand in for a re-encoded PNG. */
+  blackSourcePng?: Buffer;
   dimensionMismatch: boolean;
 }
 
@@ -173,22 +191,38 @@ async function getGeneration(
   return await ctx.runQuery(internal.generations.getById, { generationId });
 }
 
-async function loadStoredImage(
+interface StoredImageBytes {
+  raw: Buffer;
+  mimeType: GeminiImageResult["mimeType"];
+}
+
+/** Loads a stored image as raw bytes, for callers that decode it locally rather than send it to Gemini. */
+async function loadStoredImageBytes(
   ctx: StageActionContext,
   storageId: Id<"_storage">,
-): Promise<GeminiImageResult> {
+): Promise<StoredImageBytes> {
   const blob = await ctx.storage.get(storageId);
   if (!blob) {
     throw new Error("Stored image not found");
   }
 
-  const buffer = Buffer.from(await blob.arrayBuffer());
   return {
-    imageBase64: buffer.toString("base64"),
+    raw: Buffer.from(await blob.arrayBuffer()),
     mimeType: normalizeGeminiImageMimeType(blob.type),
   };
 }
 
+async function loadStoredImage(
+  ctx: StageActionContext,
+  storageId: Id<"_storage">,
+): Promise<GeminiImageResult> {
+  const { raw, mimeType } = await loadStoredImageBytes(ctx, storageId);
+  return {
+    imageBase64: raw.toString("base64"),
+    mimeType,
+  };
+}
+
 async function loadStoredImages(
   ctx: StageActionContext,
   storageIds: Id<"_storage">[] | undefined,
@@ -200,13 +234,19 @@ async function loadStoredImages(
   return Promise.all(storageIds.map((storageId) => loadStoredImage(ctx, storageId)));
 }
 
+function bytesToBlob(bytes: Buffer, type: string): Blob {
+  // View the Buffer's backing store in place; `new Uint8Array(bytes)` would copy it first.
+  return new Blob(
+    [new Uint8Array(bytes.buffer as ArrayBuffer, bytes.byteOffset, bytes.byteLength)],
+    { type },
+  );
+}
+
 async function storeGeneratedImage(
   ctx: StageActionContext,
-  image: GeminiImageResult,
+  image: StoredImageBytes,
 ): Promise<Id<"_storage">> {
-  const bytes = Buffer.from(image.imageBase64, "base64");
-  const blob = new Blob([new Uint8Array(bytes)], { type: image.mimeType });
-  return await ctx.storage.store(blob);
+  return await ctx.storage.store(bytesToBlob(image.raw, image.mimeType));
 }
 
 function createUserFacingFailureMessage(): string {
@@ -239,6 +279,8 @@ async function handleStageFailure(
   if (hasGenerationRunStageRetryCapacity(stage, retryCount)) {
     await ctx.runMutation(internal.generations.scheduleStageRetry, {
       generationId,
+      // Honor a rate-limit retry hint from Gemini instead of guessing with backoff.
+      retryAfterMs: getGeminiRetryDelayMs(error),
       retryCount: retryCount + 1,
       retryInstruction,
       stage,
@@ -362,70 +404,77 @@ async function handleTransparentQaFailure(
   });
 }
 
+/**
+ * A stored pass that is already a PNG and was decoded at its own size encodes
+ * the exact pixels finalize would re-encode, so its bytes are reused as is.
+ */
+function getReusableSourcePng(source: StoredImageBytes, resize: ImageSize | undefined): Buffer | undefined {
+  // The reused storage id keeps its stored content type, so both the label
+  // (taken from Gemini) and the bytes themselves must say PNG.
+  return resize === undefined && source.mimeType === "image/png" && hasPngSignature(source.raw)
+    ? source.raw
+    : undefined;
+}
+
 async function finalizePipeline(
   ctx: StageActionContext,
   generation: Doc<"generations">,
 ): Promise<PipelineResult> {
-  await updateStatus(ctx, generation._id, "finalizing", "Extracting transparency…");
+  // The status write is progress only, so it shares the round-trip with the loads.
   // Both storage IDs are written by the preceding pipeline stages; assert non-null.
-  let white = await loadStoredImage(ctx, generation.whiteBgStorageId!);
-  let black = await loadStoredImage(ctx, generation.blackBgStorageId!);
-
-  let whiteDecoded = await decodeImage(white.imageBase64, white.mimeType);
-  let blackDecoded = await decodeImage(black.imageBase64, black.mimeType);
-
-  let hadDimensionMismatch = false;
-  if (!validateDimensionMatch(
-    whiteDecoded.width,
-    whiteDecoded.height,
-    blackDecoded.width,
-    blackDecoded.height,
-  )) {
-    hadDimensionMismatch = true;
-
+  const [, [white, black]] = await Promise.all([
+    updateStatus(ctx, generation._id, "finalizing", "Extracting transparency…"),
+    Promise.all(
+      [generation.whiteBgStorageId!, generation.blackBgStorageId!].map((storageId) =>
+        loadStoredImageBytes(ctx, storageId)
+      ),
+    ),
+  ]);
+  const [whiteSize, blackSize] = await Promise.all([
+    readImageSize(white.raw),
+    readImageSize(black.raw),
+  ]);
+
+  // Settle the target size from the headers so a mismatched pass is resized as
+  // part of its decode, and an aspect-ratio failure skips decoding altogether.
+  let targetSize: ImageSize | undefined;
+  const hadDimensionMismatch = !validateDimensionMatch(
+    whiteSize.width,
+    whiteSize.height,
+    blackSize.width,
+    blackSize.height,
+  );
+  if (hadDimensionMismatch) {
     if (!aspectRatioMatches(
-      whiteDecoded.width,
-      whiteDecoded.height,
-      blackDecoded.width,
-      blackDecoded.height,
+      whiteSize.width,
+      whiteSize.height,
+      blackSize.width,
+      blackSize.height,
     )) {
       throw new AspectRatioMismatchError(
-        `Aspect ratio mismatch: white=${whiteDecoded.width}x${whiteDecoded.height}, black=${blackDecoded.width}x${blackDecoded.height}.`,
+        `Aspect ratio mismatch: white=${whiteSize.width}x${whiteSize.height}, black=${blackSize.width}x${blackSize.height}.`,
       );
     }
 
-    const targetWidth = Math.min(whiteDecoded.width, blackDecoded.width);
-    const targetHeight = Math.min(whiteDecoded.height, blackDecoded.height);
-
-    if (whiteDecoded.width !== targetWidth || whiteDecoded.height !== targetHeight) {
-      whiteDecoded = {
-        pixels: await resizeToMatch(
-          whiteDecoded.pixels,
-          whiteDecoded.width,
-          whiteDecoded.height,
-          targetWidth,
-          targetHeight,
-        ),
-        width: targetWidth,
-        height: targetHeight,
-      };
-    }
-
-    if (blackDecoded.width !== targetWidth || blackDecoded.height !== targetHeight) {
-      blackDecoded = {
-        pixels: await resizeToMatch(
-          blackDecoded.pixels,
-          blackDecoded.width,
-          blackDecoded.height,
-          targetWidth,
-          targetHeight,
-        ),
-        width: targetWidth,
-        height: targetHeight,
-      };
-    }
+    targetSize = {
+      width: Math.min(whiteSize.width, blackSize.width),
+      height: Math.min(whiteSize.height, blackSize.height),
+    };
   }
 
+  const resizeTarget = (size: ImageSize) =>
+    targetSize && (size.width !== targetSize.width || size.height !== targetSize.height)
+      ? targetSize
+      : undefined;
+
+  const whiteResize = resizeTarget(whiteSize);
+  const blackResize = resizeTarget(blackSize);
+  // sharp decodes off the JS thread, so both passes decode concurrently.
+  const [whiteDecoded, blackDecoded] = await Promise.all([
+    decodeImage(white.raw, white.mimeType, whiteResize),
+    decodeImage(black.raw, black.mimeType, blackResize),
+  ]);
+
   const matteOutput = differenceMatte({
     whiteBg: whiteDecoded.pixels,
     blackBg: blackDecoded.pixels,
@@ -437,6 +486,8 @@ async function finalizePipeline(
     matteOutput,
     whiteDecoded,
     blackDecoded,
+    whiteSourcePng: getReusableSourcePng(white, whiteResize),
+    blackSourcePng: getReusableSourcePng(black, blackResize),
     dimensionMismatch: hadDimensionMismatch,
   };
 }
@@ -455,15 +506,21 @@ export const generateWhiteBackground = internalAction({
     }
 
     const retryCount = generation.whiteBgRetryCount ?? 0;
+    // The reference loads don't depend on the attempt-start write, so their
+    // storage round-trips overlap it. Failures surface at the await below,
+    // inside the stage's error handling; the catch only keeps an early
+    // rejection from going unhandled while the mutation is in flight.
+    const referenceImagesLoad = loadStoredImages(ctx, mergedReferenceStorageIds(generation));
+    referenceImagesLoad.catch(() => undefined);
     await ctx.runMutation(internal.generations.markStageAttemptStarted, {
       generationId: args.generationId,
       stage: "white_background",
+      statusMessage: getGenerationRunRetryStatusMessage("white_background", retryCount),
     });
-    await updateStatus(ctx, args.generationId, "white_background", getGenerationRunRetryStatusMessage("white_background", retryCount));
 
     try {
-      const runtimeConfig = readGeminiRuntimeConfigFromEnv();
-      const referenceImages = await loadStoredImages(ctx, mergedReferenceStorageIds(generation));
+      const runtimeConfig = getGeminiRuntimeConfig();
+      const referenceImages = await referenceImagesLoad;
       const session = createChatSession(runtimeConfig, { aspectRatio: generation.aspectRatio });
       const retryInstruction = retryCount > 0 ? generation.whiteBgRetryInstruction : undefined;
       const prompt = referenceImages.length > 0
@@ -482,14 +539,19 @@ export const generateWhiteBackground = internalAction({
         throw Object.assign(err instanceof Error ? err : new Error(rawError), { retryInstruction: repair });
       }
 
-      const decoded = await decodeImage(result.imageBase64, result.mimeType);
+      // Turn the base64 payload into bytes once; the same buffer is validated and then stored.
+      const image: StoredImageBytes = {
+        mimeType: result.mimeType,
+        raw: Buffer.from(result.imageBase64, "base64"),
+      };
+      const decoded = await decodeImage(image.raw, image.mimeType);
       const validation = validateWhiteBackground(decoded.pixels, decoded.width, decoded.height);
       if (!validation.valid) {
         const repair = buildRepairInstruction("white_background", validation);
         throwStageValidationFailure("white_background", validation.reason, repair);
       }
 
-      const whiteBgStorageId = await storeGeneratedImage(ctx, result);
+      const whiteBgStorageId = await storeGeneratedImage(ctx, image);
       await ctx.runMutation(internal.generations.recordWhiteBackgroundSuccess, {
         generationId: args.generationId,
         retryCount,
@@ -523,16 +585,19 @@ export const generateBlackBackground = internalAction({
     }
 
     const retryCount = generation.blackBgRetryCount ?? 0;
+    // As in the white stage, the white image load overlaps the attempt-start write.
+    const whiteBgImageLoad = loadStoredImage(ctx, generation.whiteBgStorageId);
+    whiteBgImageLoad.catch(() => undefined);
     await ctx.runMutation(internal.generations.markStageAttemptStarted, {
       generationId: args.generationId,
       stage: "black_background",
+      statusMessage: getGenerationRunRetryStatusMessage("black_background", retryCount),
     });
-    await updateStatus(ctx, args.generationId, "black_background", getGenerationRunRetryStatusMessage("black_background", retryCount));
 
     try {
-      const runtimeConfig = readGeminiRuntimeConfigFromEnv();
+      const runtimeConfig = getGeminiRuntimeConfig();
       const session = createChatSession(runtimeConfig, { aspectRatio: generation.aspectRatio });
-      const whiteBgImage = await loadStoredImage(ctx, generation.whiteBgStorageId!);
+      const whiteBgImage = await whiteBgImageLoad;
       const retryInstruction = generation.blackBgRetryInstruction;
       const prompt = buildBlackBackgroundStagePrompt(retryInstruction);
 
@@ -546,14 +611,19 @@ export const generateBlackBackground = internalAction({
         throw Object.assign(err instanceof Error ? err : new Error(rawError), { retryInstruction: repair });
       }
 
-      const decoded = await decodeImage(result.imageBase64, result.mimeType);
+      // Turn the base64 payload into bytes once; the same buffer is validated and then stored.
+      const image: StoredImageBytes = {
+        mimeType: result.mimeType,
+        raw: Buffer.from(result.imageBase64, "base64"),
+      };
+      const decoded = await decodeImage(image.raw, image.mimeType);
       const validation = validateBlackBackground(decoded.pixels, decoded.width, decoded.height);
       if (!validation.valid) {
         const repair = buildRepairInstruction("black_background", validation);
         throwStageValidationFailure("black_background", validation.reason, repair);
       }
 
-      const blackBgStorageId = await storeGeneratedImage(ctx, result);
+      const blackBgStorageId = await storeGeneratedImage(ctx, image);
       await ctx.runMutation(internal.generations.recordBlackBackgroundSuccess, {
         blackBgStorageId,
         generationId: args.generationId,
@@ -590,11 +660,34 @@ export const finalizeGeneration = internalAction({
     await ctx.runMutation(internal.generations.markStageAttemptStarted, {
       generationId: args.generationId,
       stage: "finalizing",
+      statusMessage: getGenerationRunRetryStatusMessage("finalizing", retryCount),
     });
-    await updateStatus(ctx, args.generationId, "finalizing", getGenerationRunRetryStatusMessage("finalizing", retryCount));
 
     try {
       const result = await finalizePipeline(ctx, generation);
+      // sharp encodes on libuv worker threads, so start them before the
+      // synchronous QA and let them run underneath it. A failed QA simply
+      // discards them; the catch keeps that path free of unhandled rejections.
+      // The web variant is built straight from the matte pixels, so it encodes
+      // alongside the full-size PNGs instead of re-decoding the final PNG.
+      const encodedPngs = Promise.all([
+        encodePng(result.matteOutput.pixels, result.matteOutput.width, result.matteOutput.height),
+        optimizeForWeb(result.matteOutput),
+        result.whiteSourcePng ?? encodePng(
+          result.whiteDecoded.pixels,
+          result.whiteDecoded.width,
+          result.whiteDecoded.height,
+          GENERATION_CONFIG.intermediatePngCompressionLevel,
+        ),
+        result.blackSourcePng ?? encodePng(
+          result.blackDecoded.pixels,
+          result.blackDecoded.width,
+          result.blackDecoded.height,
+          GENERATION_CONFIG.intermediatePngCompressionLevel,
+        ),
+      ]);
+      encodedPngs.catch(() => undefined);
+
       await updateStatus(ctx, args.generationId, "finalizing", "Verifying transparency…");
       const transparentQa = analyzeTransparentOutput({
         whiteBg: result.whiteDecoded.pixels,
@@ -612,23 +705,22 @@ export const finalizeGeneration = internalAction({
       }
 
       await updateStatus(ctx, args.generationId, "finalizing", "Preparing final image…");
-      const [finalPng, whiteBgPng, blackBgPng] = await Promise.all([
-        encodePng(result.matteOutput.pixels, result.matteOutput.width, result.matteOutput.height),
-        encodePng(result.whiteDecoded.pixels, result.whiteDecoded.width, result.whiteDecoded.height),
-        encodePng(result.blackDecoded.pixels, result.blackDecoded.width, result.blackDecoded.height),
-      ]);
-
-      const whiteBgBlob = new Blob([new Uint8Array(whiteBgPng)], { type: "image/png" });
-      const whiteBgStorageId = await ctx.storage.store(whiteBgBlob);
-      const blackBgBlob = new Blob([new Uint8Array(blackBgPng)], { type: "image/png" });
-      const blackBgStorageId = await ctx.storage.store(blackBgBlob);
-      const resultBlob = new Blob([new Uint8Array(finalPng)], { type: "image/png" });
-      const resultStorageId = await ctx.storage.store(resultBlob);
-
-      await updateStatus(ctx, args.generationId, "finalizing", "Optimizing for download…");
-      const optimizedPng = await optimizeForWeb(finalPng);
-      const optimizedBlob = new Blob([new Uint8Array(optimizedPng)], { type: "image/png" });
-      const optimizedStorageId = await ctx.storage.store(optimizedBlob);
+      const [finalPng, optimizedPng, whiteBgPng, blackBgPng] = await encodedPngs;
+
+      // Pass PNGs that were reused byte-for-byte are already in storage under
+      // the generation's pass ids; only upload the ones that were re-encoded.
+      const storePng = (png: Buffer) => ctx.storage.store(bytesToBlob(png, "image/png"));
+      const [whiteBgStorageId, blackBgStorageId, resultStorageId, optimizedStorageId] =
+        await Promise.all([
+          result.whiteSourcePng && generation.whiteBgStorageId
+            ? generation.whiteBgStorageId
+            : storePng(whiteBgPng),
+          result.blackSourcePng && generation.blackBgStorageId
+            ? generation.blackBgStorageId
+            : storePng(blackBgPng),
+          storePng(finalPng),
+          storePng(optimizedPng),
+        ]);
 
       await ctx.runMutation(internal.generations.completeGeneration, {
         blackBgStorageId,
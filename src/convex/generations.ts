@@ -225,6 +225,7 @@ async function requestGenerationCore(
   const generationId = await ctx.db.insert("generations", generationRun);
 
   await insertGenerationOpsEventRow(ctx, {
+    createdAt: now,
     eventType: "generation_requested",
     generationDurationMs: 0,
     generationId,
@@ -435,6 +436,7 @@ async function failGenerationRecord(
 
   await insertGenerationOpsEventRow(ctx, {
     attemptDurationMs: getGenerationRunAttemptDurationMs(generation, now),
+    createdAt: now,
     error: alertError,
     eventType: "generation_failed",
     generationDurationMs: getGenerationRunDurationMs(generation, now),
@@ -518,6 +520,7 @@ export const completeGeneration = internalMutation({
 
     await insertGenerationOpsEventRow(ctx, {
       attemptDurationMs: getGenerationRunAttemptDurationMs(generation, now),
+      createdAt: now,
       eventType: "generation_completed",
       generationDurationMs: args.generationTimeMs,
       generationId: args.generationId,
@@ -537,11 +540,18 @@ export const markStageAttemptStarted = internalMutation({
   args: {
     generationId: v.id("generations"),
     stage: generationStageValidator,
+    /** Initial progress text, written in the same patch to save a round-trip. */
+    statusMessage: v.optional(v.string()),
   },
   returns: v.null(),
   handler: async (ctx, args) => {
     const generation = await ctx.db.get(args.generationId);
-    const patch = buildGenerationRunStageAttemptPatch(generation, args.stage, Date.now());
+    const patch = buildGenerationRunStageAttemptPatch(
+      generation,
+      args.stage,
+      Date.now(),
+      args.statusMessage,
+    );
     if (!patch) {
       return null;
     }
@@ -579,6 +589,7 @@ export const recordWhiteBackgroundSuccess = internalMutation({
 
     await insertGenerationOpsEventRow(ctx, {
       attemptDurationMs: getGenerationRunAttemptDurationMs(generation, now),
+      createdAt: now,
       eventType: "stage_succeeded",
       generationDurationMs: getGenerationRunDurationMs(generation, now),
       generationId: args.generationId,
@@ -622,6 +633,7 @@ export const recordBlackBackgroundSuccess = internalMutation({
 
     await insertGenerationOpsEventRow(ctx, {
       attemptDurationMs: getGenerationRunAttemptDurationMs(generation, now),
+      createdAt: now,
       eventType: "stage_succeeded",
       generationDurationMs: getGenerationRunDurationMs(generation, now),
       generationId: args.generationId,
@@ -641,6 +653,7 @@ export const scheduleStageRetry = internalMutation({
   args: {
     generationId: v.id("generations"),
     expectedStage: v.optional(generationStageValidator),
+    retryAfterMs: v.optional(v.number()),
     retryCount: v.number(),
     retryInstruction: v.optional(v.string()),
     downstreamRetryInstruction: v.optional(v.string()),
@@ -664,6 +677,7 @@ export const scheduleStageRetry = internalMutation({
     const retry = buildGenerationRunRetry(generation, {
       downstreamRetryInstruction: args.downstreamRetryInstruction,
       now,
+      retryAfterMs: args.retryAfterMs,
       retryCount: args.retryCount,
       retryInstruction: args.retryInstruction,
       stage: args.stage,
@@ -673,6 +687,7 @@ export const scheduleStageRetry = internalMutation({
 
     await insertGenerationOpsEventRow(ctx, {
       attemptDurationMs: getGenerationRunAttemptDurationMs(generation, now),
+      createdAt: now,
       eventType: "stage_retry_scheduled",
       generationDurationMs: getGenerationRunDurationMs(generation, now),
       generationId: args.generationId,
@@ -951,13 +966,15 @@ export const deleteStorageFiles = internalMutation({
 
     for (let offset = 0; offset < uniqueStorageIds.length; offset += STORAGE_DELETE_CHUNK_SIZE) {
       const chunk = uniqueStorageIds.slice(offset, offset + STORAGE_DELETE_CHUNK_SIZE);
-      for (const storageId of chunk) {
+      // Each file's lookup and delete are independent of the others, so a chunk
+      // is issued concurrently; the chunk size bounds how many are in flight.
+      await Promise.all(chunk.map(async (storageId) => {
         const existing = await ctx.db.system.get("_storage", storageId as Id<"_storage">);
         if (!existing) {
-          continue;
+          return;
         }
         await ctx.storage.delete(storageId as Id<"_storage">);
-      }
+      }));
     }
 
     console.log("deleteStorageFiles", {
@@ -1062,6 +1079,7 @@ export const cleanupStaleGenerations = internalMutation({
 
         await insertGenerationOpsEventRow(ctx, {
           attemptDurationMs: getGenerationRunAttemptDurationMs(gen, now),
+          createdAt: now,
           error: stallError,
           eventType: "generation_stalled",
           generationDurationMs: getGenerationRunDurationMs(gen, now),
@@ -0,0 +1,12 @@
+/**
+ * Full-jitter exponential backoff: a uniform draw from [0, base * 2^attempt).
+ * Callers that fail together (e.g. on a shared 429) spread their retries across
+ * the window instead of re-firing in lockstep.
+ */
+export function getFullJitterDelayMs(
+  baseDelayMs: number,
+  retryAttemptIndex: number,
+  random: () => number = Math.random,
+): number {
+  return Math.floor(random() * baseDelayMs * Math.pow(2, retryAttemptIndex));
+}
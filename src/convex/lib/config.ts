@@ -40,6 +40,8 @@ export const GENERATION_CONFIG = {
   maxRetriesTotal: 0,
   maxFinalizeRetries: 1,
   retryBaseDelayMs: 1500,
+  /** Upper bound on a server-requested retry delay (Google RetryInfo). */
+  retryMaxDelayMs: 60 * 1000,
   stalledGenerationWarningMs: 5 * 60 * 1000,
   staleGenerationTimeoutMs: 15 * 60 * 1000,
 
@@ -107,6 +109,9 @@ export const GENERATION_CONFIG = {
   /** Max rows per cron tick — prevents large single-transaction deletes. */
   expiredGenerationArtifactCleanupBatchSize: 20,
 
+  /** zlib level for the stored white/black pass PNGs; speed over size. */
+  intermediatePngCompressionLevel: 1,
+
   // Image optimization (Normal Resolution variant)
   optimizedMaxDimension: 1024,
   optimizedPngQuality: 80,
@@ -163,6 +168,12 @@ export const LOTTIE_GENERATION_CONFIG = {
   defaultModel: "gemini-3.5-flash",
   maxActiveGenerations: 3,
   maxAttempts: 2,
+  /** In-place retries per model call on 429/5xx before the attempt fails. */
+  maxTransientRetries: 2,
+  /** Full-jitter backoff base for transient retries without a server hint. */
+  transientRetryBaseDelayMs: 2 * 1000,
+  /** Upper bound on the wait before a transient retry, including server hints. */
+  transientRetryMaxDelayMs: 30 * 1000,
   maxJsonBytes: 400_000,
   maxLayers: 80,
   maxPromptLength: 4_000,
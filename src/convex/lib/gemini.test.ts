@@ -1,5 +1,12 @@
-import { describe, expect, it } from 'vitest';
-import { readGeminiRuntimeConfigFromEnv } from './gemini.js';
+import { afterEach, describe, expect, it, vi } from 'vitest';
+import {
+	getGeminiClient,
+	getGeminiRetryDelayMs,
+	getGeminiRuntimeConfig,
+	isTransientGeminiError,
+	readGeminiRuntimeConfigFromEnv,
+	retryTransientGeminiErrors
+} from './gemini.js';
 
 describe('readGeminiRuntimeConfigFromEnv', () => {
 	it('parses service account json credentials and normalizes the private key', () => {
@@ -45,3 +52,93 @@ describe('readGeminiRuntimeConfigFromEnv', () => {
 		);
 	});
 });
+
+describe('getGeminiRuntimeConfig', () => {
+	afterEach(() => {
+		vi.unstubAllEnvs();
+	});
+
+	it('reuses the parsed config until a vertex variable changes', () => {
+		vi.stubEnv('VERTEX_AI_PROJECT_ID', 'celstate-prod');
+		const first = getGeminiRuntimeConfig();
+		expect(getGeminiRuntimeConfig()).toBe(first);
+
+		vi.stubEnv('VERTEX_AI_PROJECT_ID', 'celstate-staging');
+		const next = getGeminiRuntimeConfig();
+		expect(next).not.toBe(first);
+		expect(next.project).toBe('celstate-staging');
+	});
+});
+
+describe('getGeminiClient', () => {
+	it('shares one client per runtime config object', () => {
+		const config = { location: 'global', project: 'celstate-prod' };
+		const client = getGeminiClient(config);
+
+		expect(getGeminiClient(config)).toBe(client);
+		expect(getGeminiClient({ ...config })).not.toBe(client);
+	});
+});
+
+describe('getGeminiRetryDelayMs', () => {
+	it('reads the RetryInfo delay from a rate-limit error message', () => {
+		const error = new Error(
+			JSON.stringify({
+				error: {
+					code: 429,
+					status: 'RESOURCE_EXHAUSTED',
+					details: [{ '@type': 'type.googleapis.com/google.rpc.RetryInfo', retryDelay: '12.5s' }]
+				}
+			})
+		);
+
+		expect(getGeminiRetryDelayMs(error)).toBe(12_500);
+	});
+
+	it('returns undefined when the error carries no retry hint', () => {
+		expect(getGeminiRetryDelayMs(new Error('Gemini returned no candidates'))).toBeUndefined();
+		expect(getGeminiRetryDelayMs('boom')).toBeUndefined();
+	});
+});
+
+describe('isTransientGeminiError', () => {
+	it('retries rate limits and server errors only', () => {
+		expect(isTransientGeminiError(Object.assign(new Error('quota'), { status: 429 }))).toBe(true);
+		expect(isTransientGeminiError(Object.assign(new Error('unavailable'), { status: 503 }))).toBe(true);
+		expect(isTransientGeminiError(Object.assign(new Error('bad request'), { status: 400 }))).toBe(false);
+		expect(isTransientGeminiError(new Error('no status'))).toBe(false);
+	});
+});
+
+describe('retryTransientGeminiErrors', () => {
+	const options = { baseDelayMs: 1_000, maxDelayMs: 30_000, maxRetries: 2, random: () => 0.5 };
+
+	it('does not retry non-transient errors', async () => {
+		const call = vi.fn().mockRejectedValue(Object.assign(new Error('bad request'), { status: 400 }));
+		const sleep = vi.fn().mockResolvedValue(undefined);
+
+		await expect(retryTransientGeminiErrors(call, { ...options, sleep })).rejects.toThrow('bad request');
+		expect(call).toHaveBeenCalledTimes(1);
+		expect(sleep).not.toHaveBeenCalled();
+	});
+
+	it('retries transient errors with jittered backoff until the call succeeds', async () => {
+		const call = vi
+			.fn()
+			.mockRejectedValueOnce(Object.assign(new Error('unavailable'), { status: 503 }))
+			.mockResolvedValueOnce('ok');
+		const sleep = vi.fn().mockResolvedValue(undefined);
+
+		await expect(retryTransientGeminiErrors(call, { ...options, sleep })).resolves.toBe('ok');
+		expect(call).toHaveBeenCalledTimes(2);
+		expect(sleep).toHaveBeenCalledWith(500);
+	});
+
+	it('gives up after maxRetries transient failures', async () => {
+		const call = vi.fn().mockRejectedValue(Object.assign(new Error('quota'), { status: 429 }));
+		const sleep = vi.fn().mockResolvedValue(undefined);
+
+		await expect(retryTransientGeminiErrors(call, { ...options, sleep })).rejects.toThrow('quota');
+		expect(call).toHaveBeenCalledTimes(3);
+	});
+});
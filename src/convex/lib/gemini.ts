@@ -1,5 +1,6 @@
 import { GoogleGenAI, ThinkingLevel } from "@google/genai";
 export { ThinkingLevel };
+import { getFullJitterDelayMs } from "./backoff.js";
 import { GENERATION_CONFIG } from "./config.js";
 
 type GeminiImageMimeType =
@@ -164,6 +165,99 @@ export function readGeminiRuntimeConfigFromEnv(
   };
 }
 
+const RUNTIME_CONFIG_ENV_NAMES = [
+  "GCLOUD_PROJECT",
+  "GOOGLE_APPLICATION_CREDENTIALS",
+  "GOOGLE_CLOUD_LOCATION",
+  "GOOGLE_CLOUD_PROJECT",
+  "VERTEX_AI_CLIENT_EMAIL",
+  "VERTEX_AI_LOCATION",
+  "VERTEX_AI_PRIVATE_KEY",
+  "VERTEX_AI_PRIVATE_KEY_ID",
+  "VERTEX_AI_PROJECT_ID",
+  "VERTEX_AI_SERVICE_ACCOUNT_JSON",
+] as const;
+
+let cachedRuntimeConfig: { config: GeminiRuntimeConfig; envKey: string } | undefined;
+
+/**
+ * Runtime config for the current process env. Warm action instances reuse the
+ * parsed config while the Vertex variables are unchanged, so each stage skips
+ * re-parsing and re-validating the service-account credentials.
+ */
+export function getGeminiRuntimeConfig(): GeminiRuntimeConfig {
+  const envKey = RUNTIME_CONFIG_ENV_NAMES.map((name) => process.env[name] ?? "").join("\0");
+  if (cachedRuntimeConfig?.envKey !== envKey) {
+    cachedRuntimeConfig = { config: readGeminiRuntimeConfigFromEnv(process.env), envKey };
+  }
+  return cachedRuntimeConfig.config;
+}
+
+// Rate limiting and server-side failures; anything else (bad request, auth,
+// safety blocks) fails the same way on a second try.
+const TRANSIENT_GEMINI_STATUSES = new Set([429, 500, 502, 503, 504]);
+
+/** True for Gemini/Vertex API errors that are worth retrying in place. */
+export function isTransientGeminiError(error: unknown): boolean {
+  const status = (error as { status?: unknown } | null | undefined)?.status;
+  return typeof status === "number" && TRANSIENT_GEMINI_STATUSES.has(status);
+}
+
+export interface TransientRetryOptions {
+  baseDelayMs: number;
+  maxDelayMs: number;
+  maxRetries: number;
+  random?: () => number;
+  sleep?: (ms: number) => Promise<void>;
+}
+
+const sleep = (ms: number) => new Promise<void>((resolve) => setTimeout(resolve, ms));
+
+/**
+ * Runs `call`, retrying in place on transient Gemini errors (429/5xx) up to
+ * `maxRetries` times. Waits for the server's RetryInfo hint when present,
+ * otherwise full-jitter backoff; either way capped at `maxDelayMs`. Any other
+ * error is rethrown immediately.
+ */
+export async function retryTransientGeminiErrors<T>(
+  call: () => Promise<T>,
+  options: TransientRetryOptions,
+): Promise<T> {
+  for (let retry = 0; ; retry++) {
+    try {
+      return await call();
+    } catch (error) {
+      if (retry >= options.maxRetries || !isTransientGeminiError(error)) {
+        throw error;
+      }
+      const delayMs = getGeminiRetryDelayMs(error)
+        ?? getFullJitterDelayMs(options.baseDelayMs, retry, options.random);
+      await (options.sleep ?? sleep)(Math.min(delayMs, options.maxDelayMs));
+    }
+  }
+}
+
+const RETRY_DELAY_PATTERN = /"retryDelay"\s*:\s*"(\d+(?:\.\d+)?)s"/;
+
+/**
+ * Reads the server-requested backoff from a Gemini/Vertex error. Rate-limit
+ * (429 / RESOURCE_EXHAUSTED) responses carry a `google.rpc.RetryInfo` detail
+ * whose `retryDelay` ("12s", "0.5s") the SDK leaves inside the error message.
+ * Returns the delay in milliseconds, or undefined when there is no hint.
+ */
+export function getGeminiRetryDelayMs(error: unknown): number | undefined {
+  if (!(error instanceof Error)) {
+    return undefined;
+  }
+
+  const match = RETRY_DELAY_PATTERN.exec(error.message);
+  if (!match) {
+    return undefined;
+  }
+
+  return Math.round(Number(match[1]) * 1000);
+}
+
 export function createGeminiClient(runtimeConfig: GeminiRuntimeConfig): GoogleGenAI {
   return new GoogleGenAI({
     ...(runtimeConfig.googleAuthOptions
@@ -175,12 +269,28 @@ export function createGeminiClient(runtimeConfig: GeminiRuntimeConfig): GoogleGe
   });
 }
 
+const geminiClients = new WeakMap<GeminiRuntimeConfig, GoogleGenAI>();
+
+/**
+ * Shared client per runtime config. Reusing it across calls in a warm action
+ * instance keeps the Vertex auth token cache and HTTP connections alive
+ * instead of re-authenticating for every stage.
+ */
+export function getGeminiClient(runtimeConfig: GeminiRuntimeConfig): GoogleGenAI {
+  let client = geminiClients.get(runtimeConfig);
+  if (!client) {
+    client = createGeminiClient(runtimeConfig);
+    geminiClients.set(runtimeConfig, client);
+  }
+  return client;
+}
+
 export async function generateStructuredText(
   runtimeConfig: GeminiRuntimeConfig,
   args: GeminiStructuredTextArgs,
   client?: GoogleGenAI,
 ): Promise<string> {
-  const ai = client ?? createGeminiClient(runtimeConfig);
+  const ai = client ?? getGeminiClient(runtimeConfig);
   const response = await ai.models.generateContent({
     model: args.model,
     contents: args.prompt,
@@ -219,19 +329,17 @@ function extractImageFromResponse(response: {
     throw new Error("Gemini returned no parts in response");
   }
 
-  for (const part of parts) {
-    if (part.inlineData?.data) {
-      const mimeType = normalizeGeminiImageMimeType(part.inlineData.mimeType);
-      return {
-        imageBase64: part.inlineData.data,
-        mimeType,
-      };
-    }
+  const imageData = parts.find((part) => part.inlineData?.data)?.inlineData;
+  if (!imageData?.data) {
+    throw new Error(
+      "Gemini returned response without image data (text-only response)",
+    );
   }
 
-  throw new Error(
-    "Gemini returned response without image data (text-only response)",
-  );
+  return {
+    imageBase64: imageData.data,
+    mimeType: normalizeGeminiImageMimeType(imageData.mimeType),
+  };
 }
 
 export function createChatSession(
@@ -242,7 +350,7 @@ export function createChatSession(
   },
   client?: GoogleGenAI,
 ): GeminiChatSession {
-  const ai = client ?? createGeminiClient(runtimeConfig);
+  const ai = client ?? getGeminiClient(runtimeConfig);
 
   const aspectRatio = config?.aspectRatio ?? GENERATION_CONFIG.defaultAspectRatio;
   const imageSize = config?.imageSize ?? GENERATION_CONFIG.defaultImageSize;
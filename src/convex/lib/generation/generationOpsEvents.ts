@@ -4,6 +4,8 @@ import type { GenerationStage } from "./generationRun.js";
 
 export type GenerationOpsEventInsert = {
   attemptDurationMs?: number;
+  /** Caller's clock reading, so the row matches the durations computed from it. */
+  createdAt?: number;
   error?: string;
   eventType: Doc<"generationOpsEvents">["eventType"];
   generationDurationMs?: number;
@@ -26,7 +28,7 @@ export async function insertGenerationOpsEventRow(
 ): Promise<void> {
   await ctx.db.insert("generationOpsEvents", {
     attemptDurationMs: args.attemptDurationMs,
-    createdAt: Date.now(),
+    createdAt: args.createdAt ?? Date.now(),
     error: args.error,
     eventType: args.eventType,
     generationDurationMs: args.generationDurationMs,
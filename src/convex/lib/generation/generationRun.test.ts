@@ -7,6 +7,7 @@ import {
   createGenerationRun,
   getGenerationRunAttemptDurationMs,
   getGenerationRunLastProgressAt,
+  getGenerationRunRetryDelayMs,
   getGenerationRunStageRetryCount,
   hasGenerationRunStageRetryCapacity,
 } from "./generationRun.js";
@@ -33,6 +34,12 @@ describe("generation run module", () => {
       stageStartedAt: 140,
     });
     expect(buildGenerationRunStageAttemptPatch(run, "black_background", 140)).toBeNull();
+    expect(buildGenerationRunStageAttemptPatch(run, "white_background", 150, "Creating your image…")).toEqual({
+      lastProgressAt: 150,
+      stageStartedAt: 150,
+      stalledAlertedAt: undefined,
+      statusMessage: "Creating your image…",
+    });
   });
 
   it("advances the run through white and black stage success transitions", () => {
@@ -85,13 +92,16 @@ describe("generation run module", () => {
       {
         downstreamRetryInstruction: "repair black pass",
         now: 320,
+        random: () => 0.5,
         retryCount: 1,
         retryInstruction: "repair white pass",
         stage: "white_background",
       },
     );
 
-    expect(retry.delayMs).toBe(1500);
+    expect(retry.delayMs).toBe(750);
+    expect(getGenerationRunRetryDelayMs(2, () => 0)).toBe(0);
+    expect(getGenerationRunRetryDelayMs(2, () => 0.999)).toBe(5994);
     expect(retry.statusMessage).toBe("Refining details…");
     expect(retry.totalRetryCount).toBe(1);
     expect(retry.patch).toEqual({
@@ -1,4 +1,5 @@
 import type { Doc, Id } from "../../_generated/dataModel.js";
+import { getFullJitterDelayMs } from "../backoff.js";
 import { GENERATION_CONFIG } from "../config.js";
 import { generationStageValidator } from "../validation/validators.js";
 import type { GenerationStage } from "../../../lib/generation-types.js";
@@ -48,6 +49,10 @@ type GenerationStageSuccessArgs =
 interface GenerationRetryArgs {
   downstreamRetryInstruction?: string;
   now: number;
+  /** Source for the backoff jitter; defaults to `Math.random`. */
+  random?: () => number;
+  /** Server-requested delay (e.g. Google RetryInfo); replaces the jittered backoff when present. */
+  retryAfterMs?: number;
   retryCount: number;
   retryInstruction?: string;
   stage: GenerationStage;
@@ -98,8 +103,12 @@ export function getGenerationRunRetryStatusMessage(stage: GenerationStage, retry
   }
 }
 
-export function getGenerationRunRetryDelayMs(retryAttemptIndex: number): number {
-  return GENERATION_CONFIG.retryBaseDelayMs * Math.pow(2, retryAttemptIndex);
+/** Full-jitter backoff for stage retries, scaled by the image pipeline's base delay. */
+export function getGenerationRunRetryDelayMs(
+  retryAttemptIndex: number,
+  random: () => number = Math.random,
+): number {
+  return getFullJitterDelayMs(GENERATION_CONFIG.retryBaseDelayMs, retryAttemptIndex, random);
 }
 
 export function getGenerationRunLastProgressAt(record: Pick<GenerationProgressRecord, "createdAt" | "lastProgressAt">): number {
@@ -201,11 +210,19 @@ export function buildGenerationRunStageAttemptPatch(
   generation: GenerationRunnableRecord | null,
   stage: GenerationStage,
   now: number,
+  statusMessage?: string,
 ): GenerationRunPatch | null {
   if (!isGenerationRunStageRunnable(generation, stage)) {
     return null;
   }
 
+  if (statusMessage !== undefined) {
+    return {
+      ...buildGenerationRunStatusPatch(statusMessage, now),
+      stageStartedAt: now,
+    };
+  }
+
   return {
     lastProgressAt: now,
     stageStartedAt: now,
@@ -256,7 +273,9 @@ export function buildGenerationRunRetry(
   const statusMessage = getGenerationRunRetryStatusMessage(args.stage, args.retryCount);
 
   return {
-    delayMs: getGenerationRunRetryDelayMs(Math.max(args.retryCount - 1, 0)),
+    delayMs: args.retryAfterMs !== undefined
+      ? Math.min(args.retryAfterMs, GENERATION_CONFIG.retryMaxDelayMs)
+      : getGenerationRunRetryDelayMs(Math.max(args.retryCount - 1, 0), args.random),
     statusMessage,
     totalRetryCount,
     patch: {
@@ -0,0 +1,38 @@
+import { describe, expect, it } from "vitest";
+import { differenceMatte } from "./matte.js";
+
+function singlePixelMatte(
+  white: [number, number, number],
+  black: [number, number, number],
+): number[] {
+  const output = differenceMatte({
+    whiteBg: new Uint8ClampedArray([...white, 255]),
+    blackBg: new Uint8ClampedArray([...black, 255]),
+    width: 1,
+    height: 1,
+  });
+  return Array.from(output.pixels);
+}
+
+describe("differenceMatte", () => {
+  it("keeps opaque pixels at their black-pass color", () => {
+    expect(singlePixelMatte([200, 10, 10], [200, 10, 10])).toEqual([200, 10, 10, 255]);
+  });
+
+  it("zeros pixels below the alpha floor", () => {
+    expect(singlePixelMatte([255, 255, 255], [0, 0, 0])).toEqual([0, 0, 0, 0]);
+  });
+
+  it("un-premultiplies semi-transparent pixels", () => {
+    expect(singlePixelMatte([227, 177, 152], [100, 50, 25])).toEqual([199, 100, 50, 128]);
+  });
+
+  it("rounds exact .5 ties like round(channel / (alpha / 255))", () => {
+    // alpha 50: 25 / (50 / 255) is exactly 127.5 and rounds up to 128.
+    expect(singlePixelMatte([230, 205, 205], [25, 0, 0])).toEqual([128, 0, 0, 50]);
+  });
+
+  it("clamps un-premultiplied overshoot to 255", () => {
+    expect(singlePixelMatte([255, 127, 127], [250, 0, 0])).toEqual([255, 0, 0, 128]);
+  });
+});
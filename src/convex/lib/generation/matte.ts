@@ -19,6 +19,17 @@ export interface MatteOutput {
   height: number;
 }
 
+/**
+ * Un-premultiplied channel for every (alpha, channel) pair, indexed by
+ * `alpha * 256 + channel`. Built with the original `round(channel / (alpha / 255))`
+ * so exact .5 ties round the same way, and clamped to 255.
+ */
+const UNPREMULTIPLIED_CHANNEL = Uint8Array.from({ length: 256 * 256 }, (_, index) => {
+  const alpha = index >> 8;
+  const channel = index & 0xff;
+  return alpha === 0 ? 0 : Math.min(255, Math.round(channel / (alpha / 255)));
+});
+
 export function differenceMatte(input: MatteInput): MatteOutput {
   const { whiteBg, blackBg, width, height } = input;
   const pixelCount = width * height;
@@ -45,24 +56,28 @@ export function differenceMatte(input: MatteInput): MatteOutput {
     const diffG = whiteG - blackG;
     const diffB = whiteB - blackB;
 
+    // Channel values are 0..255, so maxDiff <= 255 and alpha can never go negative;
+    // only a white pass darker than the black pass (maxDiff < 0) needs clamping.
     const maxDiff = Math.max(diffR, diffG, diffB);
-    let alpha = 255 - maxDiff;
-    alpha = Math.max(0, Math.min(255, alpha));
+    const alpha = maxDiff < 0 ? 255 : 255 - maxDiff;
 
     if (alpha < alphaFloorThreshold) {
       output[dstIdx] = 0;
       output[dstIdx + 1] = 0;
       output[dstIdx + 2] = 0;
       output[dstIdx + 3] = 0;
+    } else if (alpha > alphaCeilThreshold) {
+      // Opaque subject pixels (the bulk of a clean render) snap to alpha 255,
+      // where un-premultiplying is the identity: copy the black pass through.
+      output[dstIdx] = blackR;
+      output[dstIdx + 1] = blackG;
+      output[dstIdx + 2] = blackB;
+      output[dstIdx + 3] = 255;
     } else {
-      if (alpha > alphaCeilThreshold) {
-        alpha = 255;
-      }
-
-      const alphaFraction = alpha / 255;
-      output[dstIdx] = Math.max(0, Math.min(255, Math.round(blackR / alphaFraction)));
-      output[dstIdx + 1] = Math.max(0, Math.min(255, Math.round(blackG / alphaFraction)));
-      output[dstIdx + 2] = Math.max(0, Math.min(255, Math.round(blackB / alphaFraction)));
+      const row = alpha << 8;
+      output[dstIdx] = UNPREMULTIPLIED_CHANNEL[row + blackR];
+      output[dstIdx + 1] = UNPREMULTIPLIED_CHANNEL[row + blackG];
+      output[dstIdx + 2] = UNPREMULTIPLIED_CHANNEL[row + blackB];
       output[dstIdx + 3] = alpha;
     }
   }
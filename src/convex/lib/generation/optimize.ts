@@ -2,12 +2,14 @@
 
 import sharp from "sharp";
 import { GENERATION_CONFIG } from "../config.js";
+import type { MatteOutput } from "./matte.js";
 
 /**
- * Resize + palette-quantize a raw matte PNG buffer for web delivery.
- * Pure function: buffer in, buffer out. No Convex context, no side effects.
+ * Resize + palette-quantize the RGBA matte for web delivery.
+ * Reads the raw pixels directly so the full-size PNG never needs re-decoding.
+ * Pure function: pixels in, buffer out. No Convex context, no side effects.
  */
-export async function optimizeForWeb(pngBuffer: Buffer): Promise<Buffer> {
+export async function optimizeForWeb(matte: MatteOutput): Promise<Buffer> {
   const {
     optimizedMaxDimension,
     optimizedPngQuality,
@@ -16,7 +18,10 @@ export async function optimizeForWeb(pngBuffer: Buffer): Promise<Buffer> {
     optimizedPngDither,
   } = GENERATION_CONFIG;
 
-  return sharp(pngBuffer)
+  const { pixels, width, height } = matte;
+  return sharp(Buffer.from(pixels.buffer, pixels.byteOffset, pixels.byteLength), {
+    raw: { width, height, channels: 4 },
+  })
     .resize(optimizedMaxDimension, optimizedMaxDimension, {
       fit: "inside",
       withoutEnlargement: true,
@@ -1,51 +1,53 @@
-export function buildWhiteBgPrompt(userPrompt: string): string {
-  return `${userPrompt}.
+// Static prompt blocks are built once at module load; the builders only
+// splice in the user prompt and optional retry instruction.
+const REFERENCE_GUIDANCE =
+  "Use the attached reference images as style and subject guides. Match their visual style, color palette, and aesthetic while following the prompt description.";
 
-The subject is centered with comfortable margins from all edges.
-The background is pure solid white (#FFFFFF).
-No shadows cast onto the background. No gradients. No textures.
+const CENTERED_SUBJECT = "The subject is centered with comfortable margins from all edges.";
+
+const WHITE_BG_FIELD = `No shadows cast onto the background. No gradients. No textures.
 No ground plane. The subject floats against a perfectly flat white field.`;
+
+const WHITE_BG_SUFFIX = `${CENTERED_SUBJECT}
+The background is pure solid white (#FFFFFF).
+${WHITE_BG_FIELD}`;
+
+const WHITE_BG_RETRY_SUFFIX = `${CENTERED_SUBJECT}
+The background MUST be pure white #FFFFFF with absolutely no texture, shadow, or gradient. The entire background area must be a single flat color.
+${WHITE_BG_FIELD}`;
+
+const BLACK_BG_PROMPT = `Now regenerate the exact same subject — identical in every detail: same pose, same proportions, same colors, same lighting on the subject, same angle, same level of detail. The ONLY change is the background, which must now be pure solid black (#000000). No shadows cast onto the background. No reflections. No gradients. The subject floats against a perfectly flat black field. Everything about the subject itself must be pixel-identical to the previous image.`;
+
+const BLACK_BG_RETRY_PROMPT = `Regenerate the exact same subject — identical in every detail: same pose, same proportions, same colors, same lighting on the subject, same angle, same level of detail. The ONLY change is the background, which MUST be pure solid black #000000 with absolutely no texture, shadow, reflection, or gradient. The entire background area must be a single flat color. The subject floats against a perfectly flat black field. Everything about the subject itself must be pixel-identical to the previous image.`;
+
+function withRetryInstruction(base: string, retryInstruction?: string): string {
+  if (!retryInstruction) return base;
+  return `${base}\n\n${retryInstruction}`;
+}
+
+export function buildWhiteBgPrompt(userPrompt: string): string {
+  return `${userPrompt}.\n\n${WHITE_BG_SUFFIX}`;
 }
 
 export function buildBlackBgPrompt(): string {
-  return `Now regenerate the exact same subject — identical in every detail: same pose, same proportions, same colors, same lighting on the subject, same angle, same level of detail. The ONLY change is the background, which must now be pure solid black (#000000). No shadows cast onto the background. No reflections. No gradients. The subject floats against a perfectly flat black field. Everything about the subject itself must be pixel-identical to the previous image.`;
+  return BLACK_BG_PROMPT;
 }
 
 export function buildWhiteBgPromptWithReference(userPrompt: string): string {
-  return `${userPrompt}.
-
-Use the attached reference images as style and subject guides. Match their visual style, color palette, and aesthetic while following the prompt description.
-The subject is centered with comfortable margins from all edges.
-The background is pure solid white (#FFFFFF).
-No shadows cast onto the background. No gradients. No textures.
-No ground plane. The subject floats against a perfectly flat white field.`;
+  return `${userPrompt}.\n\n${REFERENCE_GUIDANCE}\n${WHITE_BG_SUFFIX}`;
 }
 
 export function buildWhiteBgRetryPromptWithReference(userPrompt: string, retryInstruction?: string): string {
-  const base = `${userPrompt}.
-
-Use the attached reference images as style and subject guides. Match their visual style, color palette, and aesthetic while following the prompt description.
-The subject is centered with comfortable margins from all edges.
-The background MUST be pure white #FFFFFF with absolutely no texture, shadow, or gradient. The entire background area must be a single flat color.
-No shadows cast onto the background. No gradients. No textures.
-No ground plane. The subject floats against a perfectly flat white field.`;
-  if (!retryInstruction) return base;
-  return `${base}\n\n${retryInstruction}`;
+  return withRetryInstruction(
+    `${userPrompt}.\n\n${REFERENCE_GUIDANCE}\n${WHITE_BG_RETRY_SUFFIX}`,
+    retryInstruction,
+  );
 }
 
 export function buildWhiteBgRetryPrompt(userPrompt: string, retryInstruction?: string): string {
-  const base = `${userPrompt}.
-
-The subject is centered with comfortable margins from all edges.
-The background MUST be pure white #FFFFFF with absolutely no texture, shadow, or gradient. The entire background area must be a single flat color.
-No shadows cast onto the background. No gradients. No textures.
-No ground plane. The subject floats against a perfectly flat white field.`;
-  if (!retryInstruction) return base;
-  return `${base}\n\n${retryInstruction}`;
+  return withRetryInstruction(`${userPrompt}.\n\n${WHITE_BG_RETRY_SUFFIX}`, retryInstruction);
 }
 
 export function buildBlackBgRetryPrompt(retryInstruction?: string): string {
-  const base = `Regenerate the exact same subject — identical in every detail: same pose, same proportions, same colors, same lighting on the subject, same angle, same level of detail. The ONLY change is the background, which MUST be pure solid black #000000 with absolutely no texture, shadow, reflection, or gradient. The entire background area must be a single flat color. The subject floats against a perfectly flat black field. Everything about the subject itself must be pixel-identical to the previous image.`;
-  if (!retryInstruction) return base;
-  return `${base}\n\n${retryInstruction}`;
+  return withRetryInstruction(BLACK_BG_RETRY_PROMPT, retryInstruction);
 }
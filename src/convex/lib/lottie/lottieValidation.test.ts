@@ -63,12 +63,19 @@ describe("lottieValidation", () => {
     expect(parsed.rawLottieJson).toContain("Terracotta leaf");
   });
 
+  it("stores the parsed JSON text as is", () => {
+    const parsed = parseLottieModelResponse(JSON.stringify(validLottie()));
+
+    expect(normalizeLottieJsonForStorage(parsed.rawLottieJson)).toBe(`${JSON.stringify(validLottie())}\n`);
+  });
+
   it("accepts a vector-only transparent Lottie document", () => {
     const result = validateLottieDocument({
       aspectRatio: "1:1",
       durationSeconds: 4,
       fps: 60,
       lottie: validLottie(),
+      serializedJson: JSON.stringify(validLottie()),
     });
 
     expect(result.decision).toBe("pass");
@@ -96,6 +103,7 @@ describe("lottieValidation", () => {
       durationSeconds: 4,
       fps: 60,
       lottie,
+      serializedJson: JSON.stringify(lottie),
     });
 
     expect(result.decision).toBe("fail");
@@ -107,7 +115,7 @@ describe("lottieValidation", () => {
     );
     expect(result.errors.some((error) => error.includes("sid"))).toBe(true);
     expect(result.errors.some((error) => error.includes("expression string"))).toBe(true);
-    expect(normalizeLottieJsonForStorage(validLottie()).endsWith("\n")).toBe(true);
+    expect(normalizeLottieJsonForStorage(JSON.stringify(validLottie())).endsWith("\n")).toBe(true);
   });
 
   it("rejects flat shapes not wrapped in groups and groups missing trailing transforms", () => {
@@ -144,6 +152,7 @@ describe("lottieValidation", () => {
       durationSeconds: 4,
       fps: 60,
       lottie,
+      serializedJson: JSON.stringify(lottie),
     });
 
     expect(result.decision).toBe("fail");
@@ -199,6 +208,7 @@ describe("lottieValidation", () => {
       durationSeconds: 4,
       fps: 60,
       lottie,
+      serializedJson: JSON.stringify(lottie),
     });
 
     expect(result.decision).toBe("fail");
@@ -18,6 +18,8 @@ export interface LottieValidationInput {
   durationSeconds: number;
   fps: number;
   lottie: unknown;
+  /** Compact JSON text of `lottie`, as returned by `parseLottieModelResponse`. */
+  serializedJson: string;
 }
 
 export interface ParsedLottieModelResponse {
@@ -102,9 +104,21 @@ function pushRootFieldError(
   }
 }
 
+/**
+ * Keyframe and path data make most nodes numbers or strings; the walkers below
+ * check this before building a child path so leaves never allocate one.
+ */
+function isContainer(value: unknown): value is object {
+  return value !== null && typeof value === "object";
+}
+
 function collectSidFallbackErrors(value: unknown, path: string, errors: string[]): void {
   if (Array.isArray(value)) {
-    value.forEach((item, index) => collectSidFallbackErrors(item, `${path}[${index}]`, errors));
+    value.forEach((item, index) => {
+      if (isContainer(item)) {
+        collectSidFallbackErrors(item, `${path}[${index}]`, errors);
+      }
+    });
     return;
   }
 
@@ -116,14 +130,21 @@ function collectSidFallbackErrors(value: unknown, path: string, errors: string[]
     errors.push(`${path} uses sid "${value.sid}" without a lottie-web k fallback`);
   }
 
-  for (const [key, nested] of Object.entries(value)) {
-    collectSidFallbackErrors(nested, `${path}.${key}`, errors);
+  for (const key in value) {
+    const nested = value[key];
+    if (isContainer(nested)) {
+      collectSidFallbackErrors(nested, `${path}.${key}`, errors);
+    }
   }
 }
 
 function collectExpressionErrors(value: unknown, path: string, errors: string[]): void {
   if (Array.isArray(value)) {
-    value.forEach((item, index) => collectExpressionErrors(item, `${path}[${index}]`, errors));
+    value.forEach((item, index) => {
+      if (isContainer(item)) {
+        collectExpressionErrors(item, `${path}[${index}]`, errors);
+      }
+    });
     return;
   }
 
@@ -131,16 +152,16 @@ function collectExpressionErrors(value: unknown, path: string, errors: string[])
     return;
   }
 
-  for (const [key, nested] of Object.entries(value)) {
-    const nestedPath = `${path}.${key}`;
-    if (
+  for (const key in value) {
+    const nested = value[key];
+    if (isContainer(nested)) {
+      collectExpressionErrors(nested, `${path}.${key}`, errors);
+    } else if (
       typeof nested === "string"
       && (key === "x" || key === "exp" || key === "expression")
     ) {
-      errors.push(`${nestedPath} uses an expression string, which is not supported in v1`);
-      continue;
+      errors.push(`${path}.${key} uses an expression string, which is not supported in v1`);
     }
-    collectExpressionErrors(nested, nestedPath, errors);
   }
 }
 
@@ -258,7 +279,7 @@ export function validateLottieDocument(input: LottieValidationInput): LottieVali
     return fail(["Lottie document must be a JSON object"]);
   }
 
-  const serializedBytes = Buffer.byteLength(JSON.stringify(root), "utf8");
+  const serializedBytes = Buffer.byteLength(input.serializedJson, "utf8");
   if (serializedBytes > LOTTIE_GENERATION_CONFIG.maxJsonBytes) {
     errors.push(`Lottie JSON is ${serializedBytes} bytes; max is ${LOTTIE_GENERATION_CONFIG.maxJsonBytes}`);
   }
@@ -306,6 +327,6 @@ export function validateLottieDocument(input: LottieValidationInput): LottieVali
   return fail(errors, warnings);
 }
 
-export function normalizeLottieJsonForStorage(lottie: unknown): string {
-  return `${JSON.stringify(lottie)}\n`;
+export function normalizeLottieJsonForStorage(serializedJson: string): string {
+  return `${serializedJson}\n`;
 }
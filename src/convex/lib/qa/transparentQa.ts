@@ -153,6 +153,33 @@ const EIGHT_CONNECTED_NEIGHBORS = [
   [-1, 1],
 ] as const;
 
+interface FloodScratch {
+  visited: Uint8Array;
+  queue: Int32Array;
+}
+
+/**
+ * Scratch planes shared by every flood fill of one `analyzeTransparentOutput`
+ * call, sized for the full frame so cropped passes can use a prefix.
+ */
+function createFloodScratch(length: number): FloodScratch {
+  return {
+    visited: new Uint8Array(length),
+    queue: new Int32Array(length),
+  };
+}
+
+function getFloodQueue(scratch: FloodScratch, length: number): Int32Array {
+  return scratch.queue.length >= length ? scratch.queue.subarray(0, length) : new Int32Array(length);
+}
+
+function getClearedFloodVisited(scratch: FloodScratch, length: number): Uint8Array {
+  if (scratch.visited.length >= length) {
+    return scratch.visited.subarray(0, length).fill(0);
+  }
+  return new Uint8Array(length);
+}
+
 function clampUnit(value: number): number {
   if (!Number.isFinite(value)) {
     return 0;
@@ -164,8 +191,30 @@ function escapeRegexLiteral(value: string): string {
   return value.replace(/[.*+?^${}()|[\]\\]/g, "\\$&");
 }
 
-function getNeighbors(connectivity: Connectivity) {
-  return connectivity === 4 ? FOUR_CONNECTED_NEIGHBORS : EIGHT_CONNECTED_NEIGHBORS;
+interface NeighborOffsets {
+  offsetsX: Int32Array;
+  offsetsY: Int32Array;
+  /** `offsetY * width + offsetX` for each neighbour, for the frame the table was built for. */
+  indexOffsets: Int32Array;
+}
+
+/**
+ * Flattens the neighbour table into typed arrays so the flood loop does indexed
+ * reads instead of iterator-protocol tuple destructuring. Built once per pass,
+ * not per region, since one pass can flood thousands of small regions.
+ */
+function getNeighbors(connectivity: Connectivity, width: number): NeighborOffsets {
+  const neighbors = connectivity === 4 ? FOUR_CONNECTED_NEIGHBORS : EIGHT_CONNECTED_NEIGHBORS;
+  const offsetsX = new Int32Array(neighbors.length);
+  const offsetsY = new Int32Array(neighbors.length);
+  const indexOffsets = new Int32Array(neighbors.length);
+  for (let neighbor = 0; neighbor < neighbors.length; neighbor++) {
+    const [offsetX, offsetY] = neighbors[neighbor];
+    offsetsX[neighbor] = offsetX;
+    offsetsY[neighbor] = offsetY;
+    indexOffsets[neighbor] = offsetY * width + offsetX;
+  }
+  return { offsetsX, offsetsY, indexOffsets };
 }
 
 function getStride(pixels: Uint8ClampedArray, width: number, height: number): number {
@@ -173,18 +222,39 @@ function getStride(pixels: Uint8ClampedArray, width: number, height: number): nu
   return pixels.length === pixelCount * 4 ? 4 : 3;
 }
 
-function buildAlphaArray(pixels: Uint8ClampedArray, width: number, height: number): Uint8ClampedArray {
+/** The matte's alpha channel and frame, derived once and shared by every QA pass. */
+interface AlphaPlane {
+  alpha: Uint8ClampedArray;
+  width: number;
+  height: number;
+  /** Pixel count per alpha value, gathered in the same pass that extracts the plane. */
+  histogram: Uint32Array;
+}
+
+function buildAlphaPlane(pixels: Uint8ClampedArray, width: number, height: number): AlphaPlane {
   const alpha = new Uint8ClampedArray(width * height);
+  const histogram = new Uint32Array(256);
   const stride = getStride(pixels, width, height);
   if (stride === 4) {
     for (let index = 0; index < alpha.length; index++) {
-      alpha[index] = pixels[index * 4 + 3];
+      const alphaValue = pixels[index * 4 + 3];
+      alpha[index] = alphaValue;
+      histogram[alphaValue] += 1;
     }
-    return alpha;
+    return { alpha, width, height, histogram };
   }
 
   alpha.fill(255);
-  return alpha;
+  histogram[255] = alpha.length;
+  return { alpha, width, height, histogram };
+}
+
+function countAlphaAtMost(histogram: Uint32Array, maxAlpha: number): number {
+  let count = 0;
+  for (let alphaValue = 0; alphaValue <= maxAlpha; alphaValue++) {
+    count += histogram[alphaValue];
+  }
+  return count;
 }
 
 function createBinaryMask(alpha: Uint8ClampedArray, threshold: number): Uint8Array {
@@ -197,6 +267,20 @@ function createBinaryMask(alpha: Uint8ClampedArray, threshold: number): Uint8Arr
   return mask;
 }
 
+/** Fills complementary foreground and background masks in a single pass over alpha. */
+function fillThresholdMasks(
+  alpha: Uint8ClampedArray,
+  threshold: number,
+  foreground: Uint8Array,
+  background: Uint8Array,
+): void {
+  for (let index = 0; index < alpha.length; index++) {
+    const isForeground = alpha[index] >= threshold ? 1 : 0;
+    foreground[index] = isForeground;
+    background[index] = isForeground ^ 1;
+  }
+}
+
 function createInverseMask(mask: Uint8Array): Uint8Array {
   const inverse = new Uint8Array(mask.length);
   for (let index = 0; index < mask.length; index++) {
@@ -211,25 +295,26 @@ function floodConnectedRegion(
   queue: Int32Array,
   width: number,
   height: number,
-  neighbors: readonly (readonly [number, number])[],
+  { offsetsX, offsetsY, indexOffsets }: NeighborOffsets,
   initialTail: number,
 ): number {
   let head = 0;
   let tail = initialTail;
+  const neighborCount = indexOffsets.length;
 
   while (head < tail) {
     const current = queue[head++];
     const x = current % width;
     const y = (current - x) / width;
 
-    for (const [offsetX, offsetY] of neighbors) {
-      const nextX = x + offsetX;
-      const nextY = y + offsetY;
+    for (let neighbor = 0; neighbor < neighborCount; neighbor++) {
+      const nextX = x + offsetsX[neighbor];
+      const nextY = y + offsetsY[neighbor];
       if (nextX < 0 || nextX >= width || nextY < 0 || nextY >= height) {
         continue;
       }
 
-      const nextIndex = nextY * width + nextX;
+      const nextIndex = current + indexOffsets[neighbor];
       if (mask[nextIndex] === 1 && visited[nextIndex] === 0) {
         visited[nextIndex] = 1;
         queue[tail++] = nextIndex;
@@ -241,15 +326,16 @@ function floodConnectedRegion(
 }
 
 function forEachConnectedRegion(
+  scratch: FloodScratch,
   mask: Uint8Array,
   width: number,
   height: number,
   connectivity: Connectivity,
   visitRegion: (componentSize: number, queue: Int32Array) => void,
 ): void {
-  const visited = new Uint8Array(mask.length);
-  const queue = new Int32Array(mask.length);
-  const neighbors = getNeighbors(connectivity);
+  const visited = getClearedFloodVisited(scratch, mask.length);
+  const queue = getFloodQueue(scratch, mask.length);
+  const neighbors = getNeighbors(connectivity, width);
 
   for (let index = 0; index < mask.length; index++) {
     if (mask[index] === 0 || visited[index] === 1) {
@@ -263,11 +349,18 @@ function forEachConnectedRegion(
   }
 }
 
-function floodBorderConnected(mask: Uint8Array, width: number, height: number, connectivity: Connectivity): Uint8Array {
+function floodBorderConnected(
+  scratch: FloodScratch,
+  mask: Uint8Array,
+  width: number,
+  height: number,
+  connectivity: Connectivity,
+): Uint8Array {
+  // `visited` is the result and outlives this call, so only the queue is shared.
   const visited = new Uint8Array(mask.length);
-  const queue = new Int32Array(mask.length);
+  const queue = getFloodQueue(scratch, mask.length);
   let tail = 0;
-  const neighbors = getNeighbors(connectivity);
+  const neighbors = getNeighbors(connectivity, width);
 
   const enqueue = (index: number) => {
     if (mask[index] === 0 || visited[index] === 1) {
@@ -293,6 +386,7 @@ function floodBorderConnected(mask: Uint8Array, width: number, height: number, c
 }
 
 function summarizeComponents(
+  scratch: FloodScratch,
   mask: Uint8Array,
   width: number,
   height: number,
@@ -309,7 +403,7 @@ function summarizeComponents(
   let largestArea = 0;
   let smallArea = 0;
 
-  forEachConnectedRegion(mask, width, height, connectivity, (componentSize) => {
+  forEachConnectedRegion(scratch, mask, width, height, connectivity, (componentSize) => {
     totalArea += componentSize;
     largestArea = Math.max(largestArea, componentSize);
     if (componentSize >= significantAreaThreshold) {
@@ -327,7 +421,22 @@ function summarizeComponents(
   };
 }
 
+/** The `summarizeComponents` result for a mask that is entirely empty or entirely set. */
+function summarizeUniformMask(
+  area: number,
+  significantAreaThreshold: number,
+): ReturnType<typeof summarizeComponents> {
+  const isSignificant = area > 0 && area >= significantAreaThreshold;
+  return {
+    totalArea: area,
+    significantCount: isSignificant ? 1 : 0,
+    largestArea: area,
+    smallArea: isSignificant ? 0 : area,
+  };
+}
+
 function extractSignificantMask(
+  scratch: FloodScratch,
   mask: Uint8Array,
   width: number,
   height: number,
@@ -342,7 +451,7 @@ function extractSignificantMask(
   let count = 0;
   let area = 0;
 
-  forEachConnectedRegion(mask, width, height, connectivity, (componentSize, queue) => {
+  forEachConnectedRegion(scratch, mask, width, height, connectivity, (componentSize, queue) => {
     if (componentSize >= minArea) {
       count += 1;
       area += componentSize;
@@ -355,67 +464,128 @@ function extractSignificantMask(
   return { mask: significantMask, count, area };
 }
 
-function calculateMaskDelta(left: Uint8Array, right: Uint8Array): number {
-  let unionCount = 0;
-  let symmetricDifferenceCount = 0;
+/**
+ * Like `extractSignificantMask`, but instead of materializing the mask it adds
+ * one to `frequency` under every pixel of each significant region as the region
+ * is visited.
+ */
+function accumulateSignificantRegions(
+  scratch: FloodScratch,
+  mask: Uint8Array,
+  width: number,
+  height: number,
+  connectivity: Connectivity,
+  minArea: number,
+  frequency: Uint8Array,
+): {
+  count: number;
+  area: number;
+} {
+  let count = 0;
+  let area = 0;
 
-  for (let index = 0; index < left.length; index++) {
-    const inLeft = left[index] === 1;
-    const inRight = right[index] === 1;
-    if (inLeft || inRight) {
-      unionCount += 1;
-    }
-    if (inLeft !== inRight) {
-      symmetricDifferenceCount += 1;
+  forEachConnectedRegion(scratch, mask, width, height, connectivity, (componentSize, queue) => {
+    if (componentSize >= minArea) {
+      count += 1;
+      area += componentSize;
+      for (let queueIndex = 0; queueIndex < componentSize; queueIndex++) {
+        frequency[queue[queueIndex]] += 1;
+      }
     }
-  }
+  });
 
-  if (unionCount === 0) {
+  return { count, area };
+}
+
+/**
+ * Symmetric-difference-over-union of two threshold masks of the same alpha
+ * plane. Masks at different thresholds are nested, so the union is the larger
+ * mask and the symmetric difference is the gap between the two areas.
+ */
+function calculateNestedMaskDelta(leftArea: number, rightArea: number): number {
+  const unionArea = Math.max(leftArea, rightArea);
+  if (unionArea === 0) {
     return 0;
   }
 
-  return symmetricDifferenceCount / unionCount;
+  return Math.abs(leftArea - rightArea) / unionArea;
 }
 
+/**
+ * Square (Chebyshev) dilation by `radius`, identical to `radius` rounds of
+ * 8-connected growth. The kernel is separable, so it runs as a horizontal then
+ * a vertical running-window pass: O(width * height) regardless of radius.
+ */
 function dilateMask(mask: Uint8Array, width: number, height: number, radius: number): Uint8Array {
-  let current = mask;
-  for (let step = 0; step < radius; step++) {
-    const next = current.slice();
-    for (let index = 0; index < current.length; index++) {
-      if (current[index] === 0) {
-        continue;
+  if (radius <= 0) {
+    return mask;
+  }
+
+  const horizontal = new Uint8Array(mask.length);
+  for (let y = 0; y < height; y++) {
+    const rowStart = y * width;
+    let windowCount = 0;
+    for (let x = 0; x < Math.min(radius, width - 1) + 1; x++) {
+      windowCount += mask[rowStart + x];
+    }
+    for (let x = 0; x < width; x++) {
+      horizontal[rowStart + x] = windowCount > 0 ? 1 : 0;
+      const entering = x + radius + 1;
+      if (entering < width) {
+        windowCount += mask[rowStart + entering];
       }
+      const leaving = x - radius;
+      if (leaving >= 0) {
+        windowCount -= mask[rowStart + leaving];
+      }
+    }
+  }
 
-      const x = index % width;
-      const y = (index - x) / width;
-      for (const [offsetX, offsetY] of EIGHT_CONNECTED_NEIGHBORS) {
-        const nextX = x + offsetX;
-        const nextY = y + offsetY;
-        if (nextX < 0 || nextX >= width || nextY < 0 || nextY >= height) {
-          continue;
-        }
-        next[nextY * width + nextX] = 1;
+  // The vertical pass slides a per-column window down the rows so every read
+  // stays row-major.
+  const dilated = new Uint8Array(mask.length);
+  const columnCounts = new Int32Array(width);
+  for (let y = 0; y < Math.min(radius, height - 1) + 1; y++) {
+    const rowStart = y * width;
+    for (let x = 0; x < width; x++) {
+      columnCounts[x] += horizontal[rowStart + x];
+    }
+  }
+  for (let y = 0; y < height; y++) {
+    const rowStart = y * width;
+    for (let x = 0; x < width; x++) {
+      dilated[rowStart + x] = columnCounts[x] > 0 ? 1 : 0;
+    }
+    const entering = y + radius + 1;
+    if (entering < height) {
+      const enteringStart = entering * width;
+      for (let x = 0; x < width; x++) {
+        columnCounts[x] += horizontal[enteringStart + x];
+      }
+    }
+    const leaving = y - radius;
+    if (leaving >= 0) {
+      const leavingStart = leaving * width;
+      for (let x = 0; x < width; x++) {
+        columnCounts[x] -= horizontal[leavingStart + x];
       }
     }
-    current = next;
   }
 
-  return current;
+  return dilated;
 }
 
 function analyzeRecomposition(
   whiteBg: Uint8ClampedArray,
   blackBg: Uint8ClampedArray,
   matte: MatteOutput,
+  { alpha, width, height, histogram }: AlphaPlane,
 ): RecompositionMetrics {
-  const pixelCount = matte.width * matte.height;
+  const pixelCount = width * height;
   const mattePixels = matte.pixels;
-  const whiteStride = getStride(whiteBg, matte.width, matte.height);
-  const blackStride = getStride(blackBg, matte.width, matte.height);
-  const alpha = buildAlphaArray(mattePixels, matte.width, matte.height);
+  const whiteStride = getStride(whiteBg, width, height);
+  const blackStride = getStride(blackBg, width, height);
 
-  let nonOpaqueCount = 0;
-  let transparentPixelCount = 0;
   let whiteResidualSum = 0;
   let blackResidualSum = 0;
   let channelDisagreementSum = 0;
@@ -426,134 +596,227 @@ function analyzeRecomposition(
     const whiteOffset = index * whiteStride;
     const blackOffset = index * blackStride;
     const alphaValue = alpha[index];
-    if (alphaValue < 250) {
-      nonOpaqueCount += 1;
-    }
-    if (alphaValue <= GENERATION_CONFIG.alphaFloorThreshold) {
-      transparentPixelCount += 1;
-    }
 
+    // Scalar locals only: this runs once per pixel, so no per-pixel arrays or spreads.
     const expectedDelta = 255 - alphaValue;
-    const channelDeltas = [
-      whiteBg[whiteOffset] - blackBg[blackOffset],
-      whiteBg[whiteOffset + 1] - blackBg[blackOffset + 1],
-      whiteBg[whiteOffset + 2] - blackBg[blackOffset + 2],
-    ];
-    const channelMax = Math.max(...channelDeltas);
-    const channelMin = Math.min(...channelDeltas);
-    channelDisagreementSum += (channelMax - channelMin) / 255;
-
-    const alphaResidual = Math.max(
-      Math.abs(channelDeltas[0] - expectedDelta),
-      Math.abs(channelDeltas[1] - expectedDelta),
-      Math.abs(channelDeltas[2] - expectedDelta),
+    const whiteR = whiteBg[whiteOffset];
+    const whiteG = whiteBg[whiteOffset + 1];
+    const whiteB = whiteBg[whiteOffset + 2];
+    const blackR = blackBg[blackOffset];
+    const blackG = blackBg[blackOffset + 1];
+    const blackB = blackBg[blackOffset + 2];
+
+    const deltaR = whiteR - blackR;
+    const deltaG = whiteG - blackG;
+    const deltaB = whiteB - blackB;
+    channelDisagreementSum += Math.max(deltaR, deltaG, deltaB) - Math.min(deltaR, deltaG, deltaB);
+
+    alphaResidualSum += Math.max(
+      Math.abs(deltaR - expectedDelta),
+      Math.abs(deltaG - expectedDelta),
+      Math.abs(deltaB - expectedDelta),
     );
-    alphaResidualSum += alphaResidual / 255;
-
-    const premultiplied = [
-      Math.round((mattePixels[matteOffset] * alphaValue) / 255),
-      Math.round((mattePixels[matteOffset + 1] * alphaValue) / 255),
-      Math.round((mattePixels[matteOffset + 2] * alphaValue) / 255),
-    ];
 
-    const recomposedWhite = [
-      Math.min(255, premultiplied[0] + (255 - alphaValue)),
-      Math.min(255, premultiplied[1] + (255 - alphaValue)),
-      Math.min(255, premultiplied[2] + (255 - alphaValue)),
-    ];
+    const premultipliedR = Math.round((mattePixels[matteOffset] * alphaValue) / 255);
+    const premultipliedG = Math.round((mattePixels[matteOffset + 1] * alphaValue) / 255);
+    const premultipliedB = Math.round((mattePixels[matteOffset + 2] * alphaValue) / 255);
 
-    whiteResidualSum += (
-      Math.abs(recomposedWhite[0] - whiteBg[whiteOffset])
-      + Math.abs(recomposedWhite[1] - whiteBg[whiteOffset + 1])
-      + Math.abs(recomposedWhite[2] - whiteBg[whiteOffset + 2])
-    ) / (3 * 255);
+    whiteResidualSum +=
+      Math.abs(Math.min(255, premultipliedR + expectedDelta) - whiteR)
+      + Math.abs(Math.min(255, premultipliedG + expectedDelta) - whiteG)
+      + Math.abs(Math.min(255, premultipliedB + expectedDelta) - whiteB);
 
-    blackResidualSum += (
-      Math.abs(premultiplied[0] - blackBg[blackOffset])
-      + Math.abs(premultiplied[1] - blackBg[blackOffset + 1])
-      + Math.abs(premultiplied[2] - blackBg[blackOffset + 2])
-    ) / (3 * 255);
+    blackResidualSum +=
+      Math.abs(premultipliedR - blackR)
+      + Math.abs(premultipliedG - blackG)
+      + Math.abs(premultipliedB - blackB);
   }
 
+  // The sums above are exact integers; normalize to [0, 1] once here instead of per pixel.
+  const channelScale = 1 / (255 * pixelCount);
+  const residualScale = channelScale / 3;
   return {
-    alphaPresence: nonOpaqueCount / pixelCount,
-    transparentPixelRatio: transparentPixelCount / pixelCount,
-    borderTransparencyRatio: calculateBorderTransparencyRatio(alpha, matte.width, matte.height),
-    whiteRecompositionResidual: whiteResidualSum / pixelCount,
-    blackRecompositionResidual: blackResidualSum / pixelCount,
-    recompositionResidual: Math.max(whiteResidualSum, blackResidualSum) / pixelCount,
-    channelDisagreement: channelDisagreementSum / pixelCount,
-    alphaResidual: alphaResidualSum / pixelCount,
+    alphaPresence: countAlphaAtMost(histogram, 249) / pixelCount,
+    transparentPixelRatio: countAlphaAtMost(histogram, GENERATION_CONFIG.alphaFloorThreshold) / pixelCount,
+    borderTransparencyRatio: calculateBorderTransparencyRatio(alpha, width, height),
+    whiteRecompositionResidual: whiteResidualSum * residualScale,
+    blackRecompositionResidual: blackResidualSum * residualScale,
+    recompositionResidual: Math.max(whiteResidualSum, blackResidualSum) * residualScale,
+    channelDisagreement: channelDisagreementSum * channelScale,
+    alphaResidual: alphaResidualSum * channelScale,
   };
 }
 
 function calculateBorderTransparencyRatio(alpha: Uint8ClampedArray, width: number, height: number): number {
-  const seen = new Set<number>();
+  const floor = GENERATION_CONFIG.alphaFloorThreshold;
+  // Walk each border pixel exactly once: full top and bottom rows, then the
+  // left and right columns between them. Single-row or single-column frames
+  // skip the duplicate edge instead of deduplicating through a set.
+  const bottomRowStart = (height - 1) * width;
+  let borderCount = 0;
   let transparentCount = 0;
 
-  const visit = (index: number) => {
-    if (seen.has(index)) {
-      return;
-    }
-    seen.add(index);
-    if (alpha[index] <= GENERATION_CONFIG.alphaFloorThreshold) {
+  for (let x = 0; x < width; x++) {
+    borderCount += 1;
+    if (alpha[x] <= floor) {
       transparentCount += 1;
     }
-  };
-
-  for (let x = 0; x < width; x++) {
-    visit(x);
-    visit((height - 1) * width + x);
+    if (height > 1) {
+      borderCount += 1;
+      if (alpha[bottomRowStart + x] <= floor) {
+        transparentCount += 1;
+      }
+    }
   }
 
   for (let y = 1; y < height - 1; y++) {
-    visit(y * width);
-    visit(y * width + (width - 1));
+    const rowStart = y * width;
+    borderCount += 1;
+    if (alpha[rowStart] <= floor) {
+      transparentCount += 1;
+    }
+    if (width > 1) {
+      borderCount += 1;
+      if (alpha[rowStart + width - 1] <= floor) {
+        transparentCount += 1;
+      }
+    }
   }
 
-  if (seen.size === 0) {
+  if (borderCount === 0) {
     return 0;
   }
 
-  return transparentCount / seen.size;
+  return transparentCount / borderCount;
+}
+
+interface ContentBounds {
+  x: number;
+  y: number;
+  width: number;
+  height: number;
+}
+
+/** Bounding box of the pixels with alpha at or above `threshold`, or null when there are none. */
+function findContentBounds(
+  alpha: Uint8ClampedArray,
+  width: number,
+  height: number,
+  threshold: number,
+): ContentBounds | null {
+  let minX = width;
+  let minY = height;
+  let maxX = -1;
+  let maxY = -1;
+
+  for (let y = 0; y < height; y++) {
+    const rowStart = y * width;
+    for (let x = 0; x < width; x++) {
+      if (alpha[rowStart + x] >= threshold) {
+        if (x < minX) {
+          minX = x;
+        }
+        if (x > maxX) {
+          maxX = x;
+        }
+        if (y < minY) {
+          minY = y;
+        }
+        maxY = y;
+      }
+    }
+  }
+
+  if (maxY < 0) {
+    return null;
+  }
+
+  return { x: minX, y: minY, width: maxX - minX + 1, height: maxY - minY + 1 };
+}
+
+function cropAlpha(alpha: Uint8ClampedArray, width: number, bounds: ContentBounds): Uint8ClampedArray {
+  const cropped = new Uint8ClampedArray(bounds.width * bounds.height);
+  for (let y = 0; y < bounds.height; y++) {
+    const sourceStart = (bounds.y + y) * width + bounds.x;
+    cropped.set(alpha.subarray(sourceStart, sourceStart + bounds.width), y * bounds.width);
+  }
+  return cropped;
 }
 
-function analyzeTopology(alpha: Uint8ClampedArray, width: number, height: number): TopologyAnalysis {
+function analyzeTopology(
+  { alpha, width, height, histogram }: AlphaPlane,
+  scratch: FloodScratch,
+): TopologyAnalysis {
+  // Ratios and area floors are always relative to the full frame.
   const pixelCount = width * height;
   const minHoleArea = Math.max(12, Math.round(pixelCount * GENERATION_CONFIG.transparentQaHoleMinAreaRatio));
   const minFragmentArea = Math.max(8, Math.round(pixelCount * GENERATION_CONFIG.transparentQaFragmentMinAreaRatio));
   const thresholds = GENERATION_CONFIG.transparentQaTopologyThresholds;
-  const holeFrequency = new Uint8Array(pixelCount);
-  const foregroundMasks: Uint8Array[] = [];
+  const silhouetteThreshold = GENERATION_CONFIG.transparentQaSilhouetteThreshold;
+
+  // Everything outside the content box is background at every threshold used
+  // here, and that background reaches the frame border, so components and
+  // holes come out identical on the cropped plane. Outputs with wide
+  // transparent padding then flood and sweep only the box.
+  const bounds = findContentBounds(alpha, width, height, Math.min(silhouetteThreshold, ...thresholds));
+  const regionAlpha = bounds ? cropAlpha(alpha, width, bounds) : alpha;
+  const regionWidth = bounds ? bounds.width : width;
+  const regionHeight = bounds ? bounds.height : height;
+  const regionPixelCount = regionWidth * regionHeight;
+
+  const holeFrequency = new Uint8Array(regionPixelCount);
+  let hasSignificantHoles = false;
+  const foregroundAreas: number[] = [];
   const topologySamples: TransparentQaTopologySample[] = [];
+  let silhouetteSummary: ReturnType<typeof summarizeComponents> | undefined;
+  // Per-threshold scratch planes, overwritten in full on every iteration.
+  const foregroundMask = new Uint8Array(regionPixelCount);
+  const backgroundMask = new Uint8Array(regionPixelCount);
+  const holeMask = new Uint8Array(regionPixelCount);
 
   for (const threshold of thresholds) {
-    const foregroundMask = createBinaryMask(alpha, threshold);
-    foregroundMasks.push(foregroundMask);
-
-    const foregroundSummary = summarizeComponents(
-      foregroundMask,
-      width,
-      height,
-      4,
-      minFragmentArea,
-    );
-
-    const backgroundMask = createInverseMask(foregroundMask);
-    const borderConnectedBackground = floodBorderConnected(backgroundMask, width, height, 8);
-    const holeMask = new Uint8Array(pixelCount);
-    for (let index = 0; index < pixelCount; index++) {
-      if (backgroundMask[index] === 1 && borderConnectedBackground[index] === 0) {
-        holeMask[index] = 1;
+    const foregroundArea = pixelCount - countAlphaAtMost(histogram, threshold - 1);
+    const backgroundArea = regionPixelCount - foregroundArea;
+    foregroundAreas.push(foregroundArea);
+
+    let foregroundSummary: ReturnType<typeof summarizeComponents>;
+    let significantHoles: { count: number; area: number } = { count: 0, area: 0 };
+    if (foregroundArea === 0 || backgroundArea === 0) {
+      // An empty or full mask is zero or one component and cannot enclose a
+      // hole, so the masks and floods are skipped entirely.
+      foregroundSummary = summarizeUniformMask(foregroundArea, minFragmentArea);
+    } else {
+      fillThresholdMasks(regionAlpha, threshold, foregroundMask, backgroundMask);
+      foregroundSummary = summarizeComponents(
+        scratch,
+        foregroundMask,
+        regionWidth,
+        regionHeight,
+        4,
+        minFragmentArea,
+      );
+
+      const borderConnectedBackground = floodBorderConnected(scratch, backgroundMask, regionWidth, regionHeight, 8);
+      for (let index = 0; index < regionPixelCount; index++) {
+        holeMask[index] = backgroundMask[index] === 1 && borderConnectedBackground[index] === 0 ? 1 : 0;
       }
-    }
 
-    const significantHoles = extractSignificantMask(holeMask, width, height, 8, minHoleArea);
-    for (let index = 0; index < pixelCount; index++) {
-      if (significantHoles.mask[index] === 1) {
-        holeFrequency[index] += 1;
+      significantHoles = accumulateSignificantRegions(
+        scratch,
+        holeMask,
+        regionWidth,
+        regionHeight,
+        8,
+        minHoleArea,
+        holeFrequency,
+      );
+      if (significantHoles.count > 0) {
+        hasSignificantHoles = true;
       }
     }
+    if (threshold === silhouetteThreshold) {
+      silhouetteSummary = foregroundSummary;
+    }
 
     topologySamples.push({
       threshold,
@@ -565,28 +828,42 @@ function analyzeTopology(alpha: Uint8ClampedArray, width: number, height: number
   }
 
   let volatilityAccumulator = 0;
-  for (let index = 1; index < foregroundMasks.length; index++) {
-    volatilityAccumulator += calculateMaskDelta(foregroundMasks[index - 1], foregroundMasks[index]);
+  for (let index = 1; index < foregroundAreas.length; index++) {
+    volatilityAccumulator += calculateNestedMaskDelta(foregroundAreas[index - 1], foregroundAreas[index]);
   }
-  const topologyVolatility = foregroundMasks.length > 1
-    ? volatilityAccumulator / (foregroundMasks.length - 1)
+  const topologyVolatility = foregroundAreas.length > 1
+    ? volatilityAccumulator / (foregroundAreas.length - 1)
     : 0;
 
-  const persistentHoleMask = new Uint8Array(pixelCount);
-  const fragileHoleMask = new Uint8Array(pixelCount);
-  for (let index = 0; index < pixelCount; index++) {
-    const frequency = holeFrequency[index];
-    if (frequency >= GENERATION_CONFIG.transparentQaPersistentThresholdCount) {
-      persistentHoleMask[index] = 1;
-    } else if (frequency > 0) {
-      fragileHoleMask[index] = 1;
+  // With no significant hole at any threshold holeFrequency is all zero, so
+  // both classifications are empty and their masks and floods can be skipped.
+  let persistentHoles: { count: number; area: number } = { count: 0, area: 0 };
+  let fragileHoles: { count: number; area: number } = { count: 0, area: 0 };
+  if (hasSignificantHoles) {
+    const persistentHoleMask = new Uint8Array(regionPixelCount);
+    const fragileHoleMask = new Uint8Array(regionPixelCount);
+    for (let index = 0; index < regionPixelCount; index++) {
+      const frequency = holeFrequency[index];
+      if (frequency >= GENERATION_CONFIG.transparentQaPersistentThresholdCount) {
+        persistentHoleMask[index] = 1;
+      } else if (frequency > 0) {
+        fragileHoleMask[index] = 1;
+      }
     }
-  }
 
-  const persistentHoles = extractSignificantMask(persistentHoleMask, width, height, 8, minHoleArea);
-  const fragileHoles = extractSignificantMask(fragileHoleMask, width, height, 8, minHoleArea);
-  const lowThresholdMask = createBinaryMask(alpha, GENERATION_CONFIG.transparentQaSilhouetteThreshold);
-  const fragmentSummary = summarizeComponents(lowThresholdMask, width, height, 4, minFragmentArea);
+    persistentHoles = extractSignificantMask(scratch, persistentHoleMask, regionWidth, regionHeight, 8, minHoleArea);
+    fragileHoles = extractSignificantMask(scratch, fragileHoleMask, regionWidth, regionHeight, 8, minHoleArea);
+  }
+  // The silhouette threshold is normally one of the topology thresholds, whose
+  // 4-connected summary above is exactly the fragment summary; reuse it.
+  const fragmentSummary = silhouetteSummary ?? summarizeComponents(
+    scratch,
+    createBinaryMask(regionAlpha, silhouetteThreshold),
+    regionWidth,
+    regionHeight,
+    4,
+    minFragmentArea,
+  );
 
   return {
     persistentHoleCount: persistentHoles.count,
@@ -600,11 +877,25 @@ function analyzeTopology(alpha: Uint8ClampedArray, width: number, height: number
   };
 }
 
-function analyzeShell(alpha: Uint8ClampedArray, width: number, height: number): ShellAnalysis {
-  const silhouetteMask = createBinaryMask(alpha, GENERATION_CONFIG.transparentQaSilhouetteThreshold);
-  const externalRegion = floodBorderConnected(createInverseMask(silhouetteMask), width, height, 8);
-  const nearDilated = dilateMask(silhouetteMask, width, height, GENERATION_CONFIG.transparentQaNearShellRadiusPx);
-  const farDilated = dilateMask(silhouetteMask, width, height, GENERATION_CONFIG.transparentQaFarShellRadiusPx);
+function analyzeShell({ alpha, width, height, histogram }: AlphaPlane, scratch: FloodScratch): ShellAnalysis {
+  const silhouetteThreshold = GENERATION_CONFIG.transparentQaSilhouetteThreshold;
+  // With no silhouette there is no shell; with a full-frame silhouette there
+  // is no external region for one to sit in. Either way every ring is empty.
+  const silhouetteArea = alpha.length - countAlphaAtMost(histogram, silhouetteThreshold - 1);
+  if (silhouetteArea === 0 || silhouetteArea === alpha.length) {
+    return { boundaryErrorRate: 0, externalSpill: 0, haloTail: 0 };
+  }
+
+  const silhouetteMask = createBinaryMask(alpha, silhouetteThreshold);
+  const externalRegion = floodBorderConnected(scratch, createInverseMask(silhouetteMask), width, height, 8);
+  const nearRadius = GENERATION_CONFIG.transparentQaNearShellRadiusPx;
+  const farRadius = GENERATION_CONFIG.transparentQaFarShellRadiusPx;
+  const nearDilated = dilateMask(silhouetteMask, width, height, nearRadius);
+  // Square dilations compose (r1 then r2 equals r1 + r2), so the far shell only
+  // needs the remaining steps on top of the near shell rather than a full redo.
+  const farDilated = farRadius >= nearRadius
+    ? dilateMask(nearDilated, width, height, farRadius - nearRadius)
+    : dilateMask(silhouetteMask, width, height, farRadius);
 
   let nearRingCount = 0;
   let farRingCount = 0;
@@ -794,10 +1085,12 @@ export function buildTransparentQaRetryPlan(
 }
 
 export function analyzeTransparentOutput(args: AnalyzeTransparentOutputArgs): TransparentQaResult {
-  const alpha = buildAlphaArray(args.matte.pixels, args.width, args.height);
-  const recomposition = analyzeRecomposition(args.whiteBg, args.blackBg, args.matte);
-  const topology = analyzeTopology(alpha, args.width, args.height);
-  const shell = analyzeShell(alpha, args.width, args.height);
+  const alphaPlane = buildAlphaPlane(args.matte.pixels, args.width, args.height);
+  const recomposition = analyzeRecomposition(args.whiteBg, args.blackBg, args.matte, alphaPlane);
+
+  const floodScratch = createFloodScratch(alphaPlane.alpha.length);
+  const topology = analyzeTopology(alphaPlane, floodScratch);
+  const shell = analyzeShell(alphaPlane, floodScratch);
   const matchedHoleKeywords = getMatchedHoleKeywords(args.prompt);
   const strongHoleKeywordSignal = shouldTreatKeywordsAsHoleRisk(matchedHoleKeywords);
 
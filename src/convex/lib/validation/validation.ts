@@ -76,18 +76,21 @@ function samplePatch(
   let count = 0;
 
   for (let y = startY; y < startY + patchSize; y++) {
-    for (let x = startX; x < startX + patchSize; x++) {
-      const idx = (y * width + x) * stride;
-      // Average across R, G, B channels
-      const avg = (pixels[idx] + pixels[idx + 1] + pixels[idx + 2]) / 3;
-      sum += avg;
-      sumSq += avg * avg;
+    // Walk each patch row as one contiguous span instead of recomputing the
+    // pixel offset from (x, y) for every sample.
+    const rowStart = (y * width + startX) * stride;
+    const rowEnd = rowStart + patchSize * stride;
+    for (let idx = rowStart; idx < rowEnd; idx += stride) {
+      // Sum R, G, B as integers; the divide by 3 is folded into the final scale.
+      const channelSum = pixels[idx] + pixels[idx + 1] + pixels[idx + 2];
+      sum += channelSum;
+      sumSq += channelSum * channelSum;
       count++;
     }
   }
 
-  const mean = sum / count;
-  const variance = sumSq / count - mean * mean;
+  const mean = sum / (3 * count);
+  const variance = sumSq / (9 * count) - mean * mean;
   const stdDev = Math.sqrt(Math.max(0, variance));
 
   return { mean, stdDev };
@@ -1,5 +1,6 @@
 "use node";
 
+import type { GoogleGenAI } from "@google/genai";
 import { v } from "convex/values";
 import { internalAction, type ActionCtx } from "./_generated/server.js";
 import { internal } from "./_generated/api.js";
@@ -11,8 +12,12 @@ import {
   type LottieDurationSeconds,
 } from "./lib/config.js";
 import {
+  type GeminiRuntimeConfig,
+  type GeminiStructuredTextArgs,
   generateStructuredText,
-  readGeminiRuntimeConfigFromEnv,
+  getGeminiClient,
+  getGeminiRuntimeConfig,
+  retryTransientGeminiErrors,
   ThinkingLevel,
 } from "./lib/gemini.js";
 import {
@@ -37,6 +42,24 @@ function readLottieGenerationModelFromEnv(
   return env.LOTTIE_GENERATION_MODEL?.trim() || LOTTIE_GENERATION_CONFIG.defaultModel;
 }
 
+/**
+ * Retries transient Vertex failures (429/5xx) in place, so a brief outage
+ * neither fails the run nor throws away a first attempt that only needed repair.
+ */
+async function generateStructuredTextWithRetry(
+  runtimeConfig: GeminiRuntimeConfig,
+  args: GeminiStructuredTextArgs,
+  client: GoogleGenAI,
+): Promise<string> {
+  return await retryTransientGeminiErrors(
+    () => generateStructuredText(runtimeConfig, args, client),
+    {
+      baseDelayMs: LOTTIE_GENERATION_CONFIG.transientRetryBaseDelayMs,
+      maxDelayMs: LOTTIE_GENERATION_CONFIG.transientRetryMaxDelayMs,
+      maxRetries: LOTTIE_GENERATION_CONFIG.maxTransientRetries,
+    },
+  );
+}
 
 function createValidationFailure(errors: string[]): LottieValidationResult {
   return {
@@ -79,6 +102,7 @@ function parseAndValidateLottieResponse(
         durationSeconds: generation.durationSeconds,
         fps: generation.fps,
         lottie: parsed.lottie,
+        serializedJson: parsed.rawLottieJson,
       }),
     };
   } catch (error) {
@@ -94,10 +118,10 @@ function parseAndValidateLottieResponse(
 
 async function storeLottieJson(
   ctx: Pick<ActionCtx, "storage">,
-  lottie: unknown,
+  rawLottieJson: string,
 ): Promise<Id<"_storage">> {
   const blob = new Blob(
-    [normalizeLottieJsonForStorage(lottie)],
+    [normalizeLottieJsonForStorage(rawLottieJson)],
     { type: "application/json" },
   );
   return await ctx.storage.store(blob);
@@ -107,12 +131,12 @@ async function completeGeneration(
   ctx: Pick<ActionCtx, "runMutation" | "storage">,
   generation: LottieGenerationDoc,
   expectedStatus: "generating" | "repairing",
-  lottie: unknown,
-  validation: LottieValidationResult,
+  attempt: { rawLottieJson: string; validation: LottieValidationResult },
 ): Promise<void> {
+  const { rawLottieJson, validation } = attempt;
   let lottieStorageId: Id<"_storage">;
   try {
-    lottieStorageId = await storeLottieJson(ctx, lottie);
+    lottieStorageId = await storeLottieJson(ctx, rawLottieJson);
   } catch (error) {
     await failGeneration(
       ctx,
@@ -168,14 +192,17 @@ export const generateLottie = internalAction({
       status: "generating",
     });
 
-    const runtimeConfig = readGeminiRuntimeConfigFromEnv();
+    const runtimeConfig = getGeminiRuntimeConfig();
+    // Process-wide client for this config: warm instances and the repair call
+    // reuse its auth token and connections.
+    const client = getGeminiClient(runtimeConfig);
     const model = readLottieGenerationModelFromEnv();
     const durationSeconds = normalizeDurationSeconds(generation.durationSeconds);
     const aspectRatio = normalizeAspectRatio(generation.aspectRatio);
 
     let first;
     try {
-      first = await generateStructuredText(runtimeConfig, {
+      first = await generateStructuredTextWithRetry(runtimeConfig, {
         model,
         prompt: buildLottieGenerationPrompt({
           aspectRatio,
@@ -187,7 +214,7 @@ export const generateLottie = internalAction({
         responseSchema: LOTTIE_RESPONSE_SCHEMA,
         systemInstruction: buildLottieSystemInstruction(),
         thinkingLevel: ThinkingLevel.MEDIUM,
-      });
+      }, client);
     } catch (error) {
       await failGeneration(
         ctx,
@@ -201,7 +228,7 @@ export const generateLottie = internalAction({
 
     const firstAttempt = parseAndValidateLottieResponse(first, generation);
     if (firstAttempt.validation.decision === "pass" && firstAttempt.lottie) {
-      await completeGeneration(ctx, generation, "generating", firstAttempt.lottie, firstAttempt.validation);
+      await completeGeneration(ctx, generation, "generating", firstAttempt);
       return null;
     }
 
@@ -215,7 +242,7 @@ export const generateLottie = internalAction({
 
     let repair;
     try {
-      repair = await generateStructuredText(runtimeConfig, {
+      repair = await generateStructuredTextWithRetry(runtimeConfig, {
         model,
         prompt: buildLottieRepairPrompt({
           aspectRatio,
@@ -229,7 +256,7 @@ export const generateLottie = internalAction({
         responseSchema: LOTTIE_RESPONSE_SCHEMA,
         systemInstruction: buildLottieSystemInstruction(),
         thinkingLevel: ThinkingLevel.MEDIUM,
-      });
+      }, client);
     } catch (error) {
       await failGeneration(
         ctx,
@@ -243,7 +270,7 @@ export const generateLottie = internalAction({
 
     const repairedAttempt = parseAndValidateLottieResponse(repair, generation);
     if (repairedAttempt.validation.decision === "pass" && repairedAttempt.lottie) {
-      await completeGeneration(ctx, generation, "repairing", repairedAttempt.lottie, repairedAttempt.validation);
+      await completeGeneration(ctx, generation, "repairing", repairedAttempt);
       return null;
     }
 
@@ -6,11 +6,14 @@ export function formatTimeAgo(timestamp: number): string {
 	return `${Math.floor(seconds / 86400)}d ago`;
 }
 
+const SLUG_UNSAFE_CHARS = /[^a-z0-9\s]/g;
+const SLUG_WHITESPACE_RUNS = /\s+/g;
+
 /** Slugify a prompt into a filesystem-safe stem for download filenames. */
 export function toDownloadFileSlug(prompt: string): string {
 	return prompt
 		.toLowerCase()
-		.replace(/[^a-z0-9\s]/g, '')
-		.replace(/\s+/g, '-')
+		.replace(SLUG_UNSAFE_CHARS, '')
+		.replace(SLUG_WHITESPACE_RUNS, '-')
 		.slice(0, 40);
 }